@@ -0,0 +1,143 @@
+"""Conversion pipeline benchmark.
+
+    python -m benchmarks.bench_convert --profiles small,large --files 50 --jobs 1,4 --out bench.json
+    python -m benchmarks.bench_convert --compare bench.json      # re-run and print the change
+
+For every profile x backend x concurrency level a fresh synthetic corpus is converted
+(manifest disabled) and the batch wall time, throughput and per-file uic latency are
+recorded. Results are written as JSON together with the environment they came from.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from uiconvert import Converter, make_jobs
+from uiconvert.backends import NativeBackend, WrapperBackend, find_native_uic, find_uic
+
+from .corpus import PROFILES, write_corpus
+
+
+def available_backends() -> dict[str, WrapperBackend]:
+    backends = {}
+    native = find_native_uic()
+    if native:
+        backends[NativeBackend.name] = NativeBackend(native)
+    wrapper = find_uic()
+    if wrapper:
+        backends[WrapperBackend.name] = WrapperBackend(wrapper)
+    return backends
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run_case(backend: WrapperBackend, files: list[str], jobs: int, repeat: int) -> dict:
+    """Best-of-`repeat` batch conversion of `files`."""
+    best = None
+    for _ in range(repeat):
+        out_dir = tempfile.mkdtemp(prefix="ui2py-bench-out-")
+        try:
+            summary = Converter(backend, jobs=jobs, use_cache=False).convert(make_jobs(files, out_dir))
+        finally:
+            shutil.rmtree(out_dir, ignore_errors=True)
+        if best is None or summary.wall_time < best.wall_time:
+            best = summary
+    latencies = [r.uic_time * 1000 for r in best.results]
+    return {
+        "files": len(best.results),
+        "failed": len(best.errors),
+        "wall_ms": round(best.wall_time * 1000, 3),
+        "files_per_second": round(best.throughput, 3),
+        "latency_ms_p50": round(percentile(latencies, 50), 3),
+        "latency_ms_p95": round(percentile(latencies, 95), 3),
+        "latency_ms_mean": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+        "input_bytes": sum(r.input_size for r in best.results),
+    }
+
+
+def environment(backends: dict[str, WrapperBackend]) -> dict:
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "uic": {name: b.version() for name, b in backends.items()},
+    }
+
+
+def case_key(case: dict) -> tuple:
+    return case["profile"], case["backend"], case["jobs"]
+
+
+def compare(old: dict, new: dict):
+    """Print wall-time change per case present in both result files."""
+    previous = {case_key(c): c for c in old.get("cases", [])}
+    print(f"{'profile':<8} {'backend':<12} {'jobs':>4} {'old ms':>10} {'new ms':>10} {'change':>8}")
+    for case in new["cases"]:
+        before = previous.get(case_key(case))
+        if not before or not before["wall_ms"]:
+            continue
+        change = (case["wall_ms"] - before["wall_ms"]) / before["wall_ms"] * 100
+        print(f"{case['profile']:<8} {case['backend']:<12} {case['jobs']:>4} "
+              f"{before['wall_ms']:>10.1f} {case['wall_ms']:>10.1f} {change:>+7.1f}%")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark .ui -> .py conversion on synthetic forms.")
+    parser.add_argument("--profiles", default="small,medium,large",
+                        help=f"comma separated, from: {', '.join(PROFILES)} (default: small,medium,large)")
+    parser.add_argument("--files", type=int, default=20, help="forms per profile (default: 20)")
+    parser.add_argument("--jobs", default=None, help="comma separated concurrency levels (default: 1 and CPU count)")
+    parser.add_argument("--backends", default=None, help="comma separated (default: every backend found)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, best one is kept (default: 3)")
+    parser.add_argument("--out", default="bench_output.json", help="result file (default: bench_output.json)")
+    parser.add_argument("--compare", metavar="FILE", help="earlier result file to compare against")
+    args = parser.parse_args(argv)
+
+    backends = available_backends()
+    if args.backends:
+        backends = {n: b for n, b in backends.items() if n in args.backends.split(",")}
+    if not backends:
+        print("bench: no uic backend found", file=sys.stderr)
+        return 2
+    profiles = [PROFILES[p] for p in args.profiles.split(",") if p in PROFILES]
+    levels = sorted({int(j) for j in args.jobs.split(",")}) if args.jobs else sorted({1, os.cpu_count() or 1})
+
+    results = {"environment": environment(backends), "cases": []}
+    corpus_root = tempfile.mkdtemp(prefix="ui2py-bench-corpus-")
+    try:
+        for profile in profiles:
+            files = write_corpus(os.path.join(corpus_root, profile.name), profile, args.files)
+            for name, backend in backends.items():
+                for jobs in levels:
+                    case = {"profile": profile.name, "backend": name, "jobs": jobs,
+                            **run_case(backend, files, jobs, max(1, args.repeat))}
+                    results["cases"].append(case)
+                    print(f"{profile.name:<8} {name:<12} j={jobs:<3} {case['wall_ms']:>10.1f} ms "
+                          f"{case['files_per_second']:>9.1f} files/s  p50 {case['latency_ms_p50']:.1f} ms "
+                          f"p95 {case['latency_ms_p95']:.1f} ms", flush=True)
+    finally:
+        shutil.rmtree(corpus_root, ignore_errors=True)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=1)
+    print(f"Results written to {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
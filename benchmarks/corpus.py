@@ -0,0 +1,107 @@
+"""Synthetic Qt Designer forms for benchmarking the conversion pipeline."""
+import itertools
+import os
+from dataclasses import dataclass
+from xml.sax.saxutils import escape
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    widgets: int       # leaf widgets in the form
+    depth: int         # nesting depth of layouts
+    strings: int = 1   # translatable string properties per widget
+
+
+PROFILES = {
+    p.name: p for p in (
+        Profile("small", widgets=20, depth=2),
+        Profile("medium", widgets=200, depth=4),
+        Profile("large", widgets=1000, depth=5),
+        Profile("huge", widgets=5000, depth=6),
+        Profile("deep", widgets=200, depth=16),
+        Profile("i18n", widgets=200, depth=4, strings=4),
+    )
+}
+
+_WIDGETS = ("QPushButton", "QLabel", "QLineEdit", "QCheckBox", "QComboBox", "QSpinBox")
+_LAYOUTS = ("QVBoxLayout", "QHBoxLayout", "QGridLayout")
+_STRING_PROPS = ("text", "toolTip", "statusTip", "whatsThis")
+
+
+def _widget(kind: str, n: int, strings: int, indent: str) -> list[str]:
+    lines = [f'{indent}<widget class="{kind}" name="{kind[1:].lower()}_{n}">']
+    props = _STRING_PROPS[:strings] if kind not in ("QLineEdit", "QSpinBox", "QComboBox") else _STRING_PROPS[1:strings + 1]
+    for prop in props:
+        lines += [f'{indent} <property name="{prop}">',
+                  f'{indent}  <string>{escape(f"{prop} of widget {n}")}</string>',
+                  f'{indent} </property>']
+    if kind == "QComboBox":
+        for i in range(3):
+            lines += [f'{indent} <item>', f'{indent}  <property name="text">',
+                      f'{indent}   <string>Option {i}</string>', f'{indent}  </property>', f'{indent} </item>']
+    lines.append(f'{indent}</widget>')
+    return lines
+
+
+def generate_form(profile: Profile, class_name: str = "Form") -> str:
+    """A syntactically valid .ui document shaped by `profile`.
+
+    Widgets are spread over a layout tree `depth` levels deep. The first few levels
+    split in two (up to 8 leaf layouts); deeper levels only nest.
+    """
+    counter = itertools.count()
+    branching = min(profile.depth - 1, 3)
+    leaves = 2 ** max(0, branching)
+    per_leaf = [profile.widgets // leaves + (1 if i < profile.widgets % leaves else 0) for i in range(leaves)]
+    leaf_iter = iter(per_leaf)
+
+    def layout(level: int, indent: str) -> list[str]:
+        kind = _LAYOUTS[level % len(_LAYOUTS)]
+        n = next(counter)
+        lines = [f'{indent}<layout class="{kind}" name="layout_{n}">']
+        if level + 1 < profile.depth:
+            fan_out = 2 if level < branching else 1
+            for i in range(fan_out):
+                pos = f' row="{i}" column="0"' if kind == "QGridLayout" else ""
+                lines.append(f'{indent} <item{pos}>')
+                lines += layout(level + 1, indent + "  ")
+                lines.append(f'{indent} </item>')
+        else:
+            for i in range(next(leaf_iter, 0)):
+                pos = f' row="{i // 4}" column="{i % 4}"' if kind == "QGridLayout" else ""
+                w = next(counter)
+                lines.append(f'{indent} <item{pos}>')
+                lines += _widget(_WIDGETS[w % len(_WIDGETS)], w, profile.strings, indent + "  ")
+                lines.append(f'{indent} </item>')
+        lines.append(f'{indent}</layout>')
+        return lines
+
+    body = layout(0, "  ")
+    return "\n".join([
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<ui version="4.0">',
+        f' <class>{class_name}</class>',
+        f' <widget class="QWidget" name="{class_name}">',
+        '  <property name="windowTitle">',
+        f'   <string>{class_name}</string>',
+        '  </property>',
+        *body,
+        ' </widget>',
+        ' <resources/>',
+        ' <connections/>',
+        '</ui>',
+        '',
+    ])
+
+
+def write_corpus(directory: str, profile: Profile, count: int) -> list[str]:
+    """Write `count` forms of `profile` into `directory`; returns their paths."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"{profile.name}_{i:04d}.ui")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(generate_form(profile, f"{profile.name.capitalize()}Form{i}"))
+        paths.append(path)
+    return paths
@@ -0,0 +1,175 @@
+"""GUI diagnostics for `ui2py.py --diagnostics`; imported only in that mode.
+
+- Event-loop stalls: a 10 ms heartbeat timer that fires late means the loop was
+  blocked for the difference.
+- Event and slot timing: `DiagnosticApplication.notify` times every event
+  dispatch. Queued signal deliveries (worker results) count as slots, paint events
+  as repaints. `instrument` also wraps chosen window methods, so direct
+  connections and helper calls show up under their own names.
+- `Overlay` shows the recent worst cases on top of the window (Ctrl+Shift+D).
+- `Tracer.export` writes everything as a Chrome trace (chrome://tracing, Perfetto).
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer
+from PySide6.QtGui import QKeySequence, QShortcut
+from PySide6.QtWidgets import QApplication, QLabel
+
+HEARTBEAT_MS = 10
+STALL_MS = 50          # later than this counts as a stall
+MIN_EVENT_MS = 1.0     # faster dispatches are counted but not traced
+MAX_EVENTS = 200_000   # trace events kept; the oldest are dropped beyond this
+WINDOW_S = 5.0         # the overlay summarises this many recent seconds
+
+
+class Tracer:
+    """Chrome trace "complete" events in a bounded ring buffer."""
+
+    def __init__(self):
+        self.events: deque[dict] = deque(maxlen=MAX_EVENTS)
+        self.t0 = time.perf_counter()
+        self.pid = os.getpid()
+        self.dispatched = 0
+
+    def add(self, name: str, cat: str, start: float, duration: float, **args):
+        event = {"name": name, "cat": cat, "ph": "X", "pid": self.pid, "tid": threading.get_ident(),
+                 "ts": round((start - self.t0) * 1e6, 1), "dur": round(duration * 1e6, 1)}
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def recent(self, seconds: float) -> list[dict]:
+        since = (time.perf_counter() - self.t0 - seconds) * 1e6
+        found = []
+        for event in reversed(self.events):
+            if event["ts"] < since:
+                break
+            found.append(event)
+        return found
+
+    def export(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": list(self.events), "displayTimeUnit": "ms"}, f)
+
+
+TRACER = Tracer()
+
+
+def _category(event_type) -> str:
+    if event_type == QEvent.Paint:
+        return "repaint"
+    if event_type == QEvent.MetaCall:
+        return "slot"
+    return "event"
+
+
+class DiagnosticApplication(QApplication):
+    """Times every event dispatch on the GUI thread."""
+
+    def notify(self, receiver, event):
+        start = time.perf_counter()
+        event_type = event.type()
+        result = super().notify(receiver, event)
+        duration = time.perf_counter() - start
+        TRACER.dispatched += 1
+        if duration * 1000 >= MIN_EVENT_MS:
+            name = receiver.objectName() or type(receiver).__name__
+            TRACER.add(f"{name}: {event_type.name}", _category(event_type), start, duration)
+        return result
+
+
+def instrument(cls, names):
+    """Replace `cls.<name>` methods with timed wrappers; call before the class is instantiated."""
+    for name in names:
+        method = getattr(cls, name)
+
+        @functools.wraps(method)
+        def timed(*args, __method=method, __name=f"{cls.__name__}.{name}", **kwargs):
+            start = time.perf_counter()
+            try:
+                return __method(*args, **kwargs)
+            finally:
+                TRACER.add(__name, "call", start, time.perf_counter() - start)
+
+        setattr(cls, name, timed)
+
+
+class StallMonitor(QObject):
+    """Records how late a short repeating timer fires: time the event loop could not run."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._beat)
+        self._last = time.perf_counter()
+        self._timer.start(HEARTBEAT_MS)
+
+    def _beat(self):
+        now = time.perf_counter()
+        late = now - self._last - HEARTBEAT_MS / 1000
+        if late * 1000 >= STALL_MS:
+            TRACER.add("event loop stall", "stall", self._last + HEARTBEAT_MS / 1000, late)
+        self._last = now
+
+
+def summary(seconds: float = WINDOW_S) -> str:
+    events = TRACER.recent(seconds)
+    lines = []
+    for cat, label in (("stall", "stalls"), ("slot", "slots"), ("repaint", "repaints"),
+                       ("call", "calls"), ("event", "events")):
+        durations = [e for e in events if e["cat"] == cat]
+        if durations:
+            worst = max(durations, key=lambda e: e["dur"])
+            lines.append(f"{label}: {len(durations)}, worst {worst['dur'] / 1000:.1f} ms ({worst['name']})")
+        elif cat in ("stall", "repaint"):
+            lines.append(f"{label}: none")
+    lines.append(f"dispatched: {TRACER.dispatched}")
+    return "\n".join(lines)
+
+
+class Overlay(QLabel):
+    """Translucent panel with the last few seconds' worst stall, slot and repaint."""
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.setObjectName("DiagnosticsOverlay")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self.setStyleSheet("background: rgba(0, 0, 0, 170); color: #9f9; font: 9pt monospace; padding: 4px;")
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(500)
+        toggle = QShortcut(QKeySequence("Ctrl+Shift+D"), window)
+        toggle.activated.connect(lambda: self.setVisible(not self.isVisible()))
+        self.refresh()
+
+    def refresh(self):
+        if not self.isVisible():
+            return
+        self.setText(f"last {WINDOW_S:.0f} s\n{summary()}")
+        self.adjustSize()
+        self.move(self.parentWidget().width() - self.width() - 4, 4)
+        self.raise_()
+
+
+def start(window, trace_path: str | None = None):
+    """Begin monitoring `window`; the trace (if any) is written when the application quits."""
+    app = QApplication.instance()
+    window._stall_monitor = StallMonitor(window)
+    window._diagnostics_overlay = Overlay(window)
+
+    def finish():
+        print(summary(float("inf")))
+        if trace_path:
+            try:
+                TRACER.export(trace_path)
+                print(f"trace written to {trace_path}")
+            except OSError as e:
+                print(f"could not write trace: {e}")
+
+    app.aboutToQuit.connect(finish)
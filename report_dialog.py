@@ -0,0 +1,43 @@
+"""Conversion report panel; imported on demand so it costs nothing at start-up."""
+import os
+
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+from PySide6.QtCore import Qt
+
+from uiconvert.report import FILE_FIELDS, file_row, run_totals
+
+
+class RunReportDialog(QDialog):
+    """Per-file timings of the last conversion batch."""
+    def __init__(self, summary, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Conversion report")
+        self.resize(900, 400)
+        totals = run_totals(summary)
+        header = QLabel(
+            f"{totals['files']} file(s) with {totals['backend']} x{totals['jobs']}: "
+            f"{totals['converted']} converted, {totals['up_to_date']} up to date, {totals['failed']} failed, "
+            f"{totals['cancelled']} cancelled - "
+            f"{totals['wall_ms']:.0f} ms wall, {totals['files_per_second']:.1f} files/s, "
+            f"uic {totals['uic_ms_total']:.0f} ms total / {totals['uic_ms_max']:.0f} ms max")
+        header.setWordWrap(True)
+
+        columns = [c for c in FILE_FIELDS if c != "output"]
+        table = QTableWidget(len(summary.results), len(columns), self)
+        table.setHorizontalHeaderLabels(columns)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        for row, result in enumerate(summary.results):
+            values = file_row(result)
+            values["src"] = os.path.basename(values["src"])
+            for col, name in enumerate(columns):
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, values[name])
+                table.setItem(row, col, item)
+        table.setSortingEnabled(True)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        table.horizontalHeader().setStretchLastSection(True)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(header)
+        layout.addWidget(table)
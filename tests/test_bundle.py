@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from uiconvert.backends import resolve_backend, resolve_rcc
+from uiconvert.cli import main
+
+FORM = """<?xml version="1.0" encoding="UTF-8"?>
+<ui version="4.0">
+ <class>MainWindow</class>
+ <widget class="QWidget" name="MainWindow">
+  <layout class="QVBoxLayout" name="layout">
+   <item><widget class="QLabel" name="label"><property name="pixmap"><pixmap resource="icons.qrc">:/icon.png</pixmap></property></widget></item>
+  </layout>
+ </widget>
+ <resources><include location="icons.qrc"/></resources>
+ <connections/>
+</ui>
+"""
+
+QRC = '<RCC><qresource prefix="/"><file>icon.png</file></qresource></RCC>\n'
+
+IMPORT = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from PySide6.QtWidgets import QApplication, QWidget
+from forms import Ui_MainWindow
+import icons_rc
+app = QApplication([])
+widget = QWidget()
+Ui_MainWindow().setupUi(widget)
+print(widget.objectName())
+"""
+
+
+@pytest.mark.skipif(resolve_backend("auto") is None or resolve_rcc() is None, reason="uic/rcc not available")
+def test_bundle_with_resources_imports(tmp_path):
+    (tmp_path / "main.ui").write_text(FORM)
+    (tmp_path / "icons.qrc").write_text(QRC)
+    (tmp_path / "icon.png").write_bytes(b"not really a png")
+    bundle = tmp_path / "dist" / "forms.zip"
+    bundle.parent.mkdir()
+    assert main(["--resources", "--bundle", str(bundle), str(tmp_path / "main.ui")]) == 0
+
+    # In a fresh interpreter whose only way to the forms is the zip
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    proc = subprocess.run([sys.executable, "-c", IMPORT, str(bundle)], cwd=bundle.parent,
+                          capture_output=True, text=True, env=env)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "MainWindow"
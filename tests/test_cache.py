@@ -0,0 +1,51 @@
+import json
+import os
+import threading
+
+import pytest
+
+from uiconvert.cache import ConversionManifest
+
+
+def test_concurrent_saves_do_not_share_a_temp_file(tmp_path):
+    errors = []
+    start = threading.Barrier(8)
+
+    def save(n):
+        manifest = ConversionManifest(str(tmp_path))
+        manifest.record(str(tmp_path / f"{n}.ui"), str(tmp_path / f"ui_{n}.py"), "x" * 64 * 100, "uic 6")
+        start.wait()
+        try:
+            for _ in range(20):
+                manifest._dirty = True
+                manifest.save()
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert os.listdir(tmp_path) == [".ui2py-manifest.json"]
+    assert len(ConversionManifest.load(str(tmp_path)).entries) == 1
+
+
+@pytest.mark.parametrize("entry", ["garbage", {"hash": 1, "uic": "u", "output": "o"}, {"hash": "h"}, None])
+@pytest.mark.parametrize("as_list", [False, True])
+def test_damaged_manifest_entries_mean_rebuild(tmp_path, entry, as_list):
+    src, output = str(tmp_path / "a.ui"), str(tmp_path / "ui_a.py")
+    files = [src, entry] if as_list else {src: entry}
+    (tmp_path / ".ui2py-manifest.json").write_text(json.dumps({"version": 1, "files": files}))
+    manifest = ConversionManifest.load(str(tmp_path))
+    assert not manifest.is_current(src, output, "h", "u")
+    manifest.record(src, output, "h", "u")
+    manifest.save()
+    assert ConversionManifest.load(str(tmp_path)).entries == manifest.entries
+
+
+def test_valid_entries_survive_a_damaged_neighbour(tmp_path):
+    good = {"hash": "h", "uic": "u", "output": "o"}
+    (tmp_path / ".ui2py-manifest.json").write_text(json.dumps({"version": 1, "files": {"a": good, "b": "garbage"}}))
+    assert ConversionManifest.load(str(tmp_path)).entries == {"a": good}
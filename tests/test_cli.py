@@ -0,0 +1,40 @@
+import glob
+import os
+
+import pytest
+
+from uiconvert.cli import build_parser, expand_inputs
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for rel in ("top.ui", "a/one.ui", "a/b/two.ui", "a/b/c/three.ui", "a/b/notes.txt", "d/b/four.ui"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("<ui/>")
+    return tmp_path
+
+
+@pytest.mark.parametrize("pattern", ["**/*.ui", "a/**/*.ui", "*/b/*.ui", "**/b/*.ui", "a/**", "*/**/c/*.ui"])
+def test_globs_match_glob_module(tree, pattern):
+    full = os.path.join(str(tree), pattern)
+    expected = sorted(os.path.normpath(p) for p in glob.glob(full, recursive=True) if p.endswith(".ui"))
+    assert expand_inputs([full]) == expected
+
+
+def test_directories_and_globs_skip_symlink_cycles(tree):
+    try:
+        os.symlink("..", tree / "a" / "loop")
+        os.symlink("../..", tree / "a" / "b" / "loop")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+    expected = sorted(str(tree / rel) for rel in ("top.ui", "a/one.ui", "a/b/two.ui", "a/b/c/three.ui", "d/b/four.ui"))
+    assert sorted(expand_inputs([str(tree)])) == expected
+    assert sorted(expand_inputs([os.path.join(str(tree), "**", "*.ui")])) == expected
+
+
+def test_optimize_is_a_flag():
+    args = build_parser().parse_args(["--optimize", "form.ui"])
+    assert args.optimize and args.paths == ["form.ui"]
+    args = build_parser().parse_args(["--optimize-passes", "lazy-pages,imports", "form.ui"])
+    assert args.optimize_passes == "lazy-pages,imports" and args.paths == ["form.ui"]
@@ -0,0 +1,97 @@
+from uiconvert.backends import WrapperBackend
+from uiconvert.core import ConversionJob, Converter, JobQueue
+
+
+def drain(queue):
+    order = []
+    while (index := queue.take()) is not None:
+        order.append(index)
+    return order
+
+
+def test_priority_then_index_order():
+    assert drain(JobQueue(5, {3: 2, 1: 1, 4: 1})) == [3, 1, 4, 0, 2]
+
+
+def test_prioritize_reorders_pending_jobs_only():
+    queue = JobQueue(5)
+    assert queue.take() == 0
+    queue.prioritize([0, 4], 5)  # 0 already started: ignored
+    queue.prioritize([2], 1)
+    queue.prioritize([4], 0)     # demoted again; the stale heap entry must not run it twice
+    assert drain(queue) == [2, 1, 3, 4]
+
+
+def test_cancel_marks_without_reordering():
+    queue = JobQueue(4, {2: 1})
+    queue.cancel([0, 3])
+    assert [queue.is_cancelled(i) for i in range(4)] == [True, False, False, True]
+    assert drain(queue) == [2, 0, 1, 3]  # cancelled jobs are still taken, so each reports back
+    assert not queue.all_cancelled
+    queue.cancel()
+    assert queue.all_cancelled and queue.is_cancelled(1)
+
+
+class FakeBackend(WrapperBackend):
+    name = "fake"
+
+    def __init__(self, on_convert=None):
+        super().__init__("fake-uic")
+        self.converted = []
+        self.on_convert = on_convert
+
+    def version(self):
+        return "fake 1"
+
+    def convert(self, src, output, cancelled=None, on_output=None, error_limit=0):
+        self.converted.append(src)
+        if self.on_convert is not None:
+            self.on_convert(src)
+        with open(output, "w") as f:
+            f.write(f"# {src}\n")
+        return 0, ""
+
+
+def make_batch(tmp_path, count):
+    jobs = []
+    for i in range(count):
+        src = tmp_path / f"f{i}.ui"
+        src.write_text(f"<ui>{i}</ui>")
+        jobs.append(ConversionJob(str(src), str(tmp_path / f"ui_f{i}.py")))
+    return jobs
+
+
+def test_converter_follows_priorities_and_cancels_pending_jobs(tmp_path):
+    jobs = make_batch(tmp_path, 6)
+    queue = JobQueue(len(jobs), {4: 2, 1: 1})
+
+    def on_convert(src):
+        if src == jobs[1].src:  # second to run: cancel two of the jobs still waiting
+            queue.cancel([0, 5])
+
+    backend = FakeBackend(on_convert)
+    summary = Converter(backend, jobs=1, use_cache=False).convert(jobs, queue=queue)
+    assert backend.converted == [jobs[i].src for i in (4, 1, 2, 3)]
+    assert [r.index for r in summary.results if r.cancelled] == [0, 5]
+    assert all(r.ok for r in summary.results if not r.cancelled)
+
+
+def test_cancel_all_stops_the_rest_of_the_batch(tmp_path):
+    jobs = make_batch(tmp_path, 5)
+    queue = JobQueue(len(jobs))
+    backend = FakeBackend(lambda src: queue.cancel())
+    summary = Converter(backend, jobs=1, use_cache=False).convert(jobs, queue=queue)
+    assert backend.converted == [jobs[0].src]
+    assert all(r.cancelled for r in summary.results)  # including the job running at the time
+
+
+def test_cancelled_since_reports_each_cancellation_once():
+    queue = JobQueue(6)
+    assert queue.cancelled_since() == ([], 0)
+    queue.cancel([4, 1])
+    new, mark = queue.cancelled_since()
+    assert new == [4, 1]
+    queue.cancel([1, 5])  # 1 again: already reported
+    new, mark = queue.cancelled_since(mark)
+    assert new == [5]
+    assert queue.cancelled_since(mark) == ([], mark)
@@ -0,0 +1,73 @@
+import json
+import os
+import socket
+import stat
+import threading
+
+import pytest
+
+from uiconvert import daemon
+from uiconvert.backends import resolve_backend
+
+backend = resolve_backend("auto")
+pytestmark = pytest.mark.skipif(backend is None, reason="uic not available")
+
+
+def _serve(monkeypatch, tmp_path, address=None):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.delenv(daemon.ENV_ADDRESS, raising=False)
+    ready = threading.Event()
+    bound = []
+    thread = threading.Thread(target=daemon.serve, args=(backend, address),
+                              kwargs={"ready": lambda a: (bound.append(a), ready.set())}, daemon=True)
+    thread.start()
+    assert ready.wait(10)
+    return bound[0], thread
+
+
+def _stop(address, thread):
+    with daemon.DaemonClient(address) as client:
+        client.shutdown()
+    thread.join(5)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"), reason="Unix sockets only")
+def test_unix_socket_is_private(monkeypatch, tmp_path):
+    address, thread = _serve(monkeypatch, tmp_path)
+    try:
+        assert os.path.dirname(address) == daemon._private_dir()
+        assert stat.S_IMODE(os.stat(os.path.dirname(address)).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(address).st_mode) & 0o077 == 0
+        assert daemon.ping(address)
+    finally:
+        _stop(address, thread)
+    assert not os.path.exists(address)
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs uids")
+def test_refuses_a_shared_directory(monkeypatch, tmp_path, capsys):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    os.mkdir(daemon._private_dir(), 0o777)
+    os.chmod(daemon._private_dir(), 0o777)
+    assert daemon.serve(backend) == 2
+    assert "not a private directory" in capsys.readouterr().err
+
+
+def test_tcp_requires_the_token(monkeypatch, tmp_path):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    address, thread = _serve(monkeypatch, tmp_path, f"127.0.0.1:{port}")
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as sock:
+            sock.sendall(b'{"op": "status"}\n')
+            reply = json.loads(sock.makefile().readline())
+            assert reply == {"event": "error", "message": "authentication required"}
+            assert sock.recv(1) == b""  # and the connection is closed
+        token_mode = os.stat(daemon._token_path(port)).st_mode
+        if hasattr(os, "getuid"):
+            assert stat.S_IMODE(token_mode) == 0o600
+        assert daemon.ping(address)
+    finally:
+        _stop(address, thread)
+    assert not os.path.exists(daemon._token_path(port))
@@ -0,0 +1,34 @@
+from uiconvert.deps import DependencyGraph
+
+FORM = """<ui version="4.0"><class>Form</class><widget class="QWidget" name="Form"/>
+<resources><include location="{qrc}"/></resources></ui>"""
+QRC = '<RCC><qresource prefix="/"><file>icon.png</file></qresource></RCC>'
+
+
+def _project(tmp_path):
+    (tmp_path / "icon.png").write_bytes(b"png")
+    (tmp_path / "res.qrc").write_text(QRC)
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.ui").write_text(FORM.format(qrc="res.qrc"))
+    graph = DependencyGraph()
+    graph.add_form(str(tmp_path / "a.ui"))
+    graph.add_form(str(tmp_path / "b.ui"))
+    return graph
+
+
+def test_removed_forms_stop_depending(tmp_path):
+    graph = _project(tmp_path)
+    icon = str(tmp_path / "icon.png")
+    graph.remove(str(tmp_path / "a.ui"))
+    assert graph.affected([icon]) == ([str(tmp_path / "b.ui")], [str(tmp_path / "res.qrc")])
+    graph.remove(str(tmp_path / "b.ui"))  # the last form using res.qrc
+    assert graph.affected([icon]) == ([], [])
+    assert graph.dependencies() == [] and graph.resources == {}
+
+
+def test_removed_resource_keeps_its_forms(tmp_path):
+    graph = _project(tmp_path)
+    qrc = str(tmp_path / "res.qrc")
+    graph.remove(qrc)
+    assert graph.affected([str(tmp_path / "icon.png")]) == ([], [])
+    assert graph.dependencies() == [qrc]  # still included, so watched again once it is back
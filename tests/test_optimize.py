@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from uiconvert.backends import resolve_backend
+from uiconvert.optimize import PASSES, optimize_source
+
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+backend = resolve_backend("auto")
+pytestmark = pytest.mark.skipif(backend is None, reason="uic not available")
+
+
+def _page(name: str, body: str) -> str:
+    return f'<widget class="QWidget" name="{name}"><attribute name="title"><string>{name}</string></attribute>' \
+           f'<layout class="QVBoxLayout" name="{name}_layout">{body}</layout></widget>'
+
+
+def _item(cls: str, name: str, text: str = "") -> str:
+    prop = f'<property name="text"><string>{text}</string></property>' if text else ""
+    return f'<item><widget class="{cls}" name="{name}">{prop}</widget></item>'
+
+
+def _form(pages: str, current: int = 0, extra: str = "", connections: str = "") -> str:
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<ui version="4.0">
+ <class>Form</class>
+ <widget class="QWidget" name="Form">
+  <layout class="QVBoxLayout" name="outer">
+   <item><widget class="QTabWidget" name="tabs"><property name="currentIndex"><number>{current}</number></property>
+   {pages}</widget></item>
+   {extra}
+  </layout>
+ </widget>
+ <connections>{connections}</connections>
+</ui>
+"""
+
+
+PLAIN = _form(_page("first", _item("QLabel", "intro", "Hello"))
+              + _page("second", _item("QLineEdit", "name") + _item("QCheckBox", "agree", "I agree"))
+              + _page("third", _item("QPushButton", "go", "Go")))
+
+# A widget on a later page is the target of a signal/slot connection made in setupUi
+CONNECTED = _form(_page("first", _item("QLabel", "intro", "Hello"))
+                  + _page("second", _item("QPushButton", "close_button", "Close")),
+                  connections="<connection><sender>close_button</sender><signal>clicked()</signal>"
+                              "<receiver>Form</receiver><slot>close()</slot></connection>")
+
+# A label outside the tabs uses a line edit on a later page as its buddy
+BUDDY = _form(_page("first", _item("QLabel", "intro", "Hello"))
+              + _page("second", _item("QLineEdit", "name")),
+              extra='<item><widget class="QLabel" name="name_label"><property name="text"><string>&amp;Name</string>'
+                    '</property><property name="buddy"><cstring>name</cstring></property></widget></item>')
+
+
+def _generate(tmp_path, xml: str) -> str:
+    src, out = tmp_path / "form.ui", tmp_path / "ui_form.py"
+    src.write_text(xml)
+    status, error = backend.convert(str(src), str(out))
+    assert status == 0, error
+    return out.read_text(encoding="utf-8")
+
+
+def _run(source: str):
+    """Exec the module, run setupUi and retranslateUi, and return (ui, widget)."""
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    namespace = {}
+    exec(compile(source, "ui_form.py", "exec"), namespace)
+    ui, widget = namespace["Ui_Form"](), QtWidgets.QWidget()
+    ui.setupUi(widget)
+    ui.retranslateUi(widget)
+    return ui, widget
+
+
+def test_lazy_pages_round_trip(tmp_path):
+    source = _generate(tmp_path, PLAIN)
+    optimized = optimize_source(source, PASSES)
+    assert "def _build_second" in optimized and "def _build_third" in optimized
+    assert "def _build_first" not in optimized  # the current page is built eagerly
+
+    ui, widget = _run(optimized)
+    assert ui.intro.text() == "Hello"
+    assert not hasattr(ui, "go")
+    ui.tabs.setCurrentIndex(2)
+    assert ui.go.text() == "Go" and ui.go.parent() is ui.third
+    assert not hasattr(ui, "name")
+    ui.build_all_pages()
+    assert ui.agree.text() == "I agree"
+    ui.retranslateUi(widget)  # also translates pages built since
+    assert [ui.tabs.tabText(i) for i in range(3)] == ["first", "second", "third"]
+
+
+@pytest.mark.parametrize("xml, widget", [(CONNECTED, "close_button"), (BUDDY, "name")], ids=["connection", "buddy"])
+def test_pages_used_outside_their_block_stay_eager(tmp_path, xml, widget):
+    source = _generate(tmp_path, xml)
+    optimized = optimize_source(source, PASSES)
+    assert "def _build_second" not in optimized
+    ui, _ = _run(optimized)
+    assert hasattr(ui, widget)
+
+
+def test_non_constant_current_index_disables_lazy_pages(tmp_path):
+    source = _generate(tmp_path, PLAIN)
+    assert "self.tabs.setCurrentIndex(0)" in source
+    source = source.replace("self.tabs.setCurrentIndex(0)", "self.tabs.setCurrentIndex(int('0'))")
+    assert optimize_source(source, ("lazy-pages",)) == source
+    ui, _ = _run(optimize_source(source, PASSES))
+    assert ui.go.text() == "Go"
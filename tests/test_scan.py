@@ -0,0 +1,75 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from uiconvert.scan import iter_ui_files
+
+
+def test_symlink_cycles_are_not_followed(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "form.ui").write_text("<ui/>")
+    try:
+        os.symlink("..", tmp_path / "a" / "loop")
+        os.symlink("../..", tmp_path / "a" / "loop2")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+    assert list(iter_ui_files(str(tmp_path))) == [str(tmp_path / "a" / "form.ui")]
+
+
+GITIGNORE = """\
+# anchoring
+/anchored.ui
+sub/anchored.ui
+floating.ui
+# negation: the last matching pattern wins
+*.gen.ui
+!keep.gen.ui
+# a re-include cannot reach into an excluded directory
+build/
+!build/rescued.ui
+# directory-only patterns do not match files
+tmp.ui/
+# double stars
+**/deep/*.ui
+a/**/z.ui
+logs/**
+!logs/**/important.ui
+"""
+
+SUB_GITIGNORE = """\
+/local.ui
+*.ui
+!keep.ui
+"""
+
+FILES = [
+    "anchored.ui", "sub/anchored.ui", "sub/sub/anchored.ui", "other/anchored.ui", "other/sub/anchored.ui",
+    "floating.ui", "x/y/floating.ui",
+    "f.gen.ui", "keep.gen.ui", "x/keep.gen.ui", "x/g.gen.ui",
+    "build/rescued.ui", "x/build/b.ui",
+    "tmp.ui", "x/tmp.ui/inside.ui",
+    "deep/d.ui", "x/deep/d.ui", "x/deep/y/d.ui",
+    "a/z.ui", "a/b/c/z.ui", "b/a/z.ui",
+    "logs/l.ui", "logs/x/important.ui", "logs/important.ui",
+    "sub/local.ui", "sub/keep.ui", "sub/other.ui", "sub/nested/keep.ui", "sub/nested/local.ui",
+    "plain.ui",
+]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_ignore_rules_agree_with_git(tmp_path):
+    (tmp_path / ".gitignore").write_text(GITIGNORE)
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / ".gitignore").write_text(SUB_GITIGNORE)
+    for rel in FILES:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("<ui/>")
+    env = dict(os.environ, GIT_CONFIG_GLOBAL=os.devnull, GIT_CONFIG_NOSYSTEM="1")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True, env=env)
+    listed = subprocess.run(["git", "ls-files", "--others", "--exclude-standard"], cwd=tmp_path, check=True,
+                            env=env, capture_output=True, text=True).stdout.split()
+    expected = sorted(rel for rel in listed if rel.endswith(".ui"))
+    found = sorted(os.path.relpath(p, tmp_path).replace(os.sep, "/") for p in iter_ui_files(str(tmp_path)))
+    assert found == expected
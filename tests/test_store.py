@@ -0,0 +1,19 @@
+import pytest
+
+from uiconvert.store import DirectoryStore, OutputStore
+
+
+def test_a_store_missing_a_method_cannot_be_created():
+    class GetOnly(OutputStore):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly()
+
+
+def test_directory_store_round_trip(tmp_path):
+    store = DirectoryStore(str(tmp_path))
+    assert store.get("ab" * 32) is None
+    store.put("ab" * 32, b"generated")
+    assert store.get("ab" * 32) == b"generated"
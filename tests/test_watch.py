@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+
+from uiconvert.watch import UiWatcher, _BatchRunner
+
+
+class FailingConverter:
+    rcc = None
+
+    def convert(self, jobs, on_result=None):
+        raise AttributeError("boom")
+
+
+@pytest.fixture
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+@pytest.fixture
+def project(tmp_path):
+    for rel in ("a.ui", "forms/b.ui", "node_modules/pkg/c.ui", "build/d.ui"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("<ui/>")
+    (tmp_path / ".gitignore").write_text("build/\n")
+    return tmp_path
+
+
+def _watched(watcher, root):
+    return sorted(os.path.relpath(p, root) for p in watcher._fs.directories())
+
+
+def test_ignored_and_linked_directories_are_not_watched(app, project):
+    try:
+        os.symlink(project / "forms", project / "link")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+    watcher = UiWatcher([str(project)], FailingConverter())
+    try:
+        files = watcher.start(initial_build=False)
+        assert sorted(os.path.relpath(f, project) for f in files) == ["a.ui", os.path.join("forms", "b.ui")]
+        assert _watched(watcher, project) == [".", "forms"]
+
+        # Created while watching: a linked folder, an ignored one and a plain one
+        os.symlink(project / "forms", project / "later_link")
+        (project / "build" / "more").mkdir()
+        (project / "new" / "sub").mkdir(parents=True)
+        (project / "new" / "sub" / "e.ui").write_text("<ui/>")
+        watcher._on_directory_changed(str(project))
+        watcher._on_directory_changed(str(project / "build"))
+        assert _watched(watcher, project) == [".", "forms", "new", os.path.join("new", "sub")]
+        assert watcher._pending == {str(project / "new" / "sub" / "e.ui")}
+    finally:
+        watcher.stop()
+
+
+def test_a_failing_batch_does_not_stop_the_watcher(app, project, capsys):
+    watcher = UiWatcher([str(project)], FailingConverter())
+    watcher._running = True
+    _BatchRunner(watcher.converter, [str(project / "a.ui")], None, watcher).run()
+    app.processEvents()
+    assert not watcher._running
+    assert "rebuild failed: AttributeError: boom" in capsys.readouterr().err
+
+
+def test_deleted_forms_leave_the_dependency_graph(app, tmp_path):
+    (tmp_path / "icon.png").write_bytes(b"png")
+    (tmp_path / "res.qrc").write_text('<RCC><qresource prefix="/"><file>icon.png</file></qresource></RCC>')
+    (tmp_path / "a.ui").write_text('<ui version="4.0"><widget class="QWidget" name="Form"/>'
+                                   '<resources><include location="res.qrc"/></resources></ui>')
+    converter = FailingConverter()
+    converter.rcc = object()
+    watcher = UiWatcher([str(tmp_path)], converter)
+    try:
+        watcher.start(initial_build=False)
+        assert watcher.graph.affected([str(tmp_path / "icon.png")])[0] == [str(tmp_path / "a.ui")]
+        os.remove(tmp_path / "a.ui")
+        watcher._on_file_changed(str(tmp_path / "a.ui"))
+        assert watcher.graph.forms == {} and watcher.graph.dependencies() == []
+    finally:
+        watcher.stop()
@@ -1,20 +1,226 @@
+import time
+_T0 = time.perf_counter()  # reference point for --startup-time
+
 import sys
 import os
-import shutil
 from pathlib import Path
-import ctypes
 
-from PySide6.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox, QSizePolicy, QMenu
-from PySide6.QtGui import QIcon, QFontMetrics
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QSize, QCoreApplication
+from PySide6.QtWidgets import (QApplication, QMainWindow, QFileDialog, QMessageBox, QSizePolicy, QMenu,
+                               QAbstractItemView)
+from PySide6.QtGui import QIcon, QBrush, QColor
+from PySide6.QtCore import (Qt, QPropertyAnimation, QEasingCurve, QSize, QCoreApplication, QEvent, QTimer,
+                            QObject, QRunnable, QThreadPool, Signal, QAbstractListModel, QModelIndex)
 
 from ui_form import Ui_MainWindow
+# Everything else from uiconvert (core, backends, scan, report) is imported where it is first needed
+from uiconvert.filestore import FileStore, path_key
+
+
+# Paths handed from the folder scanner to the list per signal
+SCAN_CHUNK = 256
+
+FAILED_BRUSH = QBrush(QColor(220, 60, 60))
 
-import subprocess
+
+class ConversionSignals(QObject):
+    """Lives in the GUI thread; the batch worker emits through it (queued connections)."""
+    file_started = Signal(int)       # job index
+    file_finished = Signal(object)   # FileResult
+    batch_finished = Signal(object)  # BatchSummary
+    preflight_failed = Signal(object)  # PreflightReport; nothing was converted
+
+
+class BatchTask(QRunnable):
+    """Checks, then drives one Converter batch from a QThreadPool worker; uic runs on the converter's own pool.
+    `queue` (a uiconvert JobQueue) stays with the GUI to reorder or cancel pending jobs."""
+    def __init__(self, converter, jobs: list, queue, signals: ConversionSignals):
+        super().__init__()
+        self.converter = converter
+        self.jobs = jobs
+        self.queue = queue
+        self.signals = signals
+
+    def run(self):
+        """Emits exactly one of `preflight_failed` and `batch_finished`, whatever goes wrong,
+        so the window never stays in its running state."""
+        from uiconvert import BatchSummary, FileResult
+        summary, refused, reported = None, False, set()
+
+        def finished(result):
+            reported.add(result.index)
+            self.signals.file_finished.emit(result)
+
+        try:
+            # Checked here rather than in the GUI thread: the XML scan reads every form the manifest
+            # does not vouch for. A daemon runs the same checks itself.
+            if hasattr(self.converter, "is_current"):
+                from uiconvert import preflight
+                checks = preflight(self.jobs, current=self.converter.is_current)
+                if not checks.ok:
+                    refused = True
+                    self.signals.preflight_failed.emit(checks)
+                    return
+            summary = self.converter.convert(self.jobs, on_result=finished,
+                                             on_start=self.signals.file_started.emit, queue=self.queue)
+        except Exception as e:
+            # ConnectionError / RuntimeError: the daemon went away or refused the batch
+            message = f"daemon: {e}" if isinstance(e, (ConnectionError, RuntimeError)) else f"{type(e).__name__}: {e}"
+            summary = BatchSummary(results=[FileResult(i, job, error=message)
+                                            for i, job in enumerate(self.jobs) if i not in reported])
+            for result in summary.results:
+                self.signals.file_finished.emit(result)
+        finally:
+            if not refused:
+                self.signals.batch_finished.emit(summary if summary is not None else BatchSummary())
+
+
+class ScanSignals(QObject):
+    chunk = Signal(int, object)  # scan id, list of paths
+    finished = Signal(int)       # scan id
+
+
+class ScanTask(QRunnable):
+    """Streams .ui files found below the given folders back to the GUI in chunks."""
+    def __init__(self, scan_id: int, roots: list[str], signals: ScanSignals):
+        super().__init__()
+        self.scan_id = scan_id
+        self.roots = roots
+        self.signals = signals
+        self.cancelled = False
+
+    def run(self):
+        from uiconvert.scan import iter_chunks, iter_ui_files
+
+        for root in self.roots:
+            for chunk in iter_chunks(iter_ui_files(root), SCAN_CHUNK):
+                if self.cancelled:
+                    return
+                self.signals.chunk.emit(self.scan_id, chunk)
+        self.signals.finished.emit(self.scan_id)
+
+
+class FileListModel(QAbstractListModel):
+    """Selected .ui files shown in ListSelectedFiles (basename and conversion state, full path as tooltip).
+
+    Files live in a path-keyed FileStore, so adding, de-duplicating and removing cost
+    O(1) per file; `_rows` only maps view rows to store keys.
+    """
+    # Removing more separate row ranges than this resets the view instead of shifting it per range
+    RESET_RANGES = 64
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = FileStore()
+        self._rows: list[str] = []
+        self._row_of: dict[str, int] | None = {}
+        self.notes: dict[str, str] = {}  # key -> conversion result
+        self.states: dict[str, str] = {}  # key -> queued / running / done ... shown next to the name
+
+    @property
+    def paths(self) -> list[str]:
+        return list(self.store)
+
+    def path(self, row: int) -> str:
+        return self.store.path(self._rows[row])
+
+    def row(self, key: str) -> int:
+        if self._row_of is None:
+            self._row_of = {k: i for i, k in enumerate(self._rows)}
+        return self._row_of.get(key, -1)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        key = self._rows[index.row()]
+        path = self.store.path(key)
+        if role == Qt.DisplayRole:
+            state = self.states.get(key)
+            return f"{os.path.basename(path)}  —  {state}" if state else os.path.basename(path)
+        if role == Qt.ToolTipRole:
+            note = self.notes.get(key)
+            return f"{path}\n{note}" if note else path
+        if role == Qt.ForegroundRole and self.states.get(key) == "failed":
+            return FAILED_BRUSH
+        return None
+
+    def set_paths(self, paths: list[str]):
+        self.beginResetModel()
+        self.store.clear()
+        self._rows = self.store.add(paths)
+        self._row_of = None
+        self.notes.clear()
+        self.states.clear()
+        self.endResetModel()
+
+    def append(self, paths: list[str]) -> int:
+        """Add paths not already listed; returns how many were new."""
+        added = self.store.add(paths)
+        if added:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._rows.extend(added)
+            if self._row_of is not None:
+                self._row_of.update((k, first + i) for i, k in enumerate(added))
+            self.endInsertRows()
+        return len(added)
+
+    def remove_rows(self, rows: list[int]):
+        rows = sorted(set(rows))
+        if not rows:
+            return
+        keys = [self._rows[r] for r in rows]
+        self.store.discard(keys)
+        for key in keys:
+            self.notes.pop(key, None)
+            self.states.pop(key, None)
+
+        # Contiguous ranges, last first, so earlier row numbers stay valid
+        ranges, start = [], rows[0]
+        for prev, cur in zip(rows, rows[1:] + [None]):
+            if cur != prev + 1:
+                ranges.append((start, prev))
+                start = cur
+        if len(ranges) > self.RESET_RANGES:
+            self.beginResetModel()
+            removed = set(keys)
+            self._rows = [k for k in self._rows if k not in removed]
+            self.endResetModel()
+        else:
+            for first, last in reversed(ranges):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                del self._rows[first:last + 1]
+                self.endRemoveRows()
+        self._row_of = None
+
+    def set_note(self, row: int, note: str):
+        if 0 <= row < len(self._rows):
+            self.notes[self._rows[row]] = note
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ToolTipRole])
+
+    def set_state(self, row: int, state: str):
+        if 0 <= row < len(self._rows):
+            self.states[self._rows[row]] = state
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ForegroundRole])
+
+    def set_states(self, rows: list[int], state: str):
+        """One state for many rows with a single change notification."""
+        if not rows:
+            return
+        for row in rows:
+            self.states[self._rows[row]] = state
+        self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)), [Qt.DisplayRole, Qt.ForegroundRole])
+
+    def rows_in_state(self, state: str) -> list[int]:
+        return [row for row, key in enumerate(self._rows) if self.states.get(key) == state]
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, jobs: int | None = None):
         super().__init__()
         
         self.ui = Ui_MainWindow()
@@ -25,6 +231,10 @@ class MainWindow(QMainWindow):
         self.window_width_anim.setEasingCurve(QEasingCurve.InOutCubic)
 
         self.ui.ListSelectedFiles.setVisible(False)
+        self.files = FileListModel(self)
+        self.ui.ListSelectedFiles.setModel(self.files)
+        self.ui.ListSelectedFiles.setUniformItemSizes(True)  # constant-time layout for big lists
+        self.ui.ListSelectedFiles.setSelectionMode(QAbstractItemView.ExtendedSelection)
 
         self._setup_output_row_layout()
         self._init_output_row_widgets()  # --- Outlook ---
@@ -35,18 +245,40 @@ class MainWindow(QMainWindow):
         self.ui.horizontalLayout_2.setSpacing(0)
         self.ui.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
 
-        self.ui.EdBase.textChanged.connect(lambda _: self._fit_to_text(self.ui.EdBase))
-
         self.setAcceptDrops(True)
         self.setWindowTitle("PySide6 UI to PY Converter")
         self.setMinimumSize(562, 201)
         self.setMaximumSize(770, 201)
         self.setWindowIcon(QIcon(ICON_PATH))
 
-        self.file_paths: list[str] = []
         self.file_name = ''
         self.file_directory = ''
 
+        # Conversion runs on a bounded worker pool so the window stays responsive
+        self.jobs = jobs  # None: one uic per CPU core
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)  # one batch at a time; the Converter fans out to `jobs` workers
+        self.conversion_signals = ConversionSignals(self)
+        self.conversion_signals.file_started.connect(self._on_file_started)
+        self.conversion_signals.file_finished.connect(self._on_file_converted)
+        self.conversion_signals.batch_finished.connect(self._on_batch_finished)
+        self.conversion_signals.preflight_failed.connect(self._on_preflight_failed)
+        self._batch_total = 0
+        self._batch_done = 0
+        self._queue = None        # JobQueue of the running batch
+        self._batch_rows = []     # job index -> list row
+        self._batch_jobs = []
+        self.last_summary = None
+
+        # Folder scans stream into the list from their own worker
+        self.scan_pool = QThreadPool(self)
+        self.scan_pool.setMaxThreadCount(1)
+        self.scan_signals = ScanSignals(self)
+        self.scan_signals.chunk.connect(self._on_scan_chunk)
+        self.scan_signals.finished.connect(self._on_scan_finished)
+        self._scan_id = 0
+        self._scan_task: ScanTask | None = None
+
         self.ui.EdBase.setPlaceholderText("file_name")
         self.ui.EdBase.setToolTip("Output file name — click to edit")
         self.ui.EdBase.setCursor(Qt.IBeamCursor)
@@ -56,8 +288,9 @@ class MainWindow(QMainWindow):
         self.setTabOrder(self.ui.BtnConvert, self.ui.EdBase)
 
         # Button signals
-        self.ui.BtnConvert.clicked.connect(self.convert)
+        self.ui.BtnConvert.clicked.connect(lambda: self.convert())
         self.ui.BtnSelectFile.clicked.connect(self.select_file)
+        self.ui.BtnAddFolder.clicked.connect(self.add_folder)
         self.ui.BtnSelectDestinationFolder.clicked.connect(self.select_folder)
         self.ui.BtnExit.clicked.connect(self.exit)
         
@@ -66,6 +299,10 @@ class MainWindow(QMainWindow):
         self.ui.ListSelectedFiles.setContextMenuPolicy(Qt.CustomContextMenu)
         self.ui.ListSelectedFiles.customContextMenuRequested.connect(self.show_list_context_menu)
 
+        # Status line: right click for the report of the last run
+        self.ui.LblStatus.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.ui.LblStatus.customContextMenuRequested.connect(self.show_status_context_menu)
+
 #region ---------------- helpers ----------------
     def _animate_list(self, show=False, hide=False):
         self.window_width_anim.stop()
@@ -115,7 +352,7 @@ class MainWindow(QMainWindow):
 
     def _fit_to_text(self, le):
         """Adjust the width of the given QLineEdit to the text (no clipping)."""
-        fm = QFontMetrics(le.font())
+        fm = le.fontMetrics()  # the widget's cached metrics; no new object per keystroke
         tm, cm = le.textMargins(), le.contentsMargins()
         extra = int(tm.left() + tm.right() + cm.left() + cm.right())
         txt = le.text() or " "                      # at least 1 character
@@ -146,12 +383,80 @@ class MainWindow(QMainWindow):
         # Suffix
         self.ui.EdSuffix.setText(".py" if self.file_directory else "")
         self._fit_to_text(self.ui.EdSuffix)
+
+    @property
+    def file_paths(self) -> list[str]:
+        return self.files.paths
+
+    def _show_selection(self, verb: str):
+        """Sync labels, output row and list visibility with the current number of files."""
+        count = self.files.rowCount()
+        if count == 1:
+            self.file_path = self.files.path(0)
+            self.file_name = os.path.basename(self.file_path)
+            self.ui.LblFileName.setText(self._norm(self.file_name))
+            self._refresh_output_row(set_default_name=True)
+            self._animate_list(hide=True)
+        elif count == 0:
+            self.ui.LblFileName.setText(QCoreApplication.translate("MainWindow", u"File not selected yet", None))
+            self._clear_output_row()
+            self._animate_list(hide=True)
+        else:
+            self.ui.LblFileName.setText(f"{count} files {verb}")
+            self._clear_output_row()
+            if not self.ui.ListSelectedFiles.isVisible():
+                self._animate_list(show=True)
+
+    def _set_selection(self, paths: list[str], verb: str):
+        self._cancel_scan()
+        self.files.set_paths(paths)
+        self._show_selection(verb)
+        self.file_directory = os.path.dirname(paths[0])
+        self.ui.LblDestinationName.setText(self._norm(self.file_directory))
+
+    def _cancel_scan(self):
+        if self._scan_task is not None:
+            self._scan_task.cancelled = True
+            self._scan_task = None
+            self._scan_id += 1
+            self.ui.BtnConvert.setEnabled(True)
+
+    def _start_scan(self, folders: list[str], files: list[str] | None = None):
+        """Replace the selection with `files` plus every .ui below `folders`, filled in as found."""
+        self._cancel_scan()
+        self.files.set_paths(files or [])
+        self.file_directory = self._norm(folders[0])
+        self.ui.LblDestinationName.setText(self.file_directory)
+        self._scan_task = ScanTask(self._scan_id, folders, self.scan_signals)
+        self.ui.BtnConvert.setEnabled(False)
+        self.ui.LblStatus.setText('Scanning...')
+        self.scan_pool.start(self._scan_task)
+
+    def _on_scan_chunk(self, scan_id: int, paths: list[str]):
+        if scan_id != self._scan_id:
+            return  # stale chunk from a cancelled scan
+        self.files.append(paths)
+        if self.files.rowCount() > 1:
+            self._show_selection("found")
+        self.ui.LblStatus.setText(f"Scanning... {self.files.rowCount()} file(s) found")
+
+    def _on_scan_finished(self, scan_id: int):
+        if scan_id != self._scan_id:
+            return
+        self._scan_task = None
+        self.ui.BtnConvert.setEnabled(True)
+        self._show_selection("found")
+        if self.files.rowCount():
+            self.ui.LblStatus.setText('Files ready for conversion')
+        else:
+            self.ui.LblStatus.setText('No .ui files found in folder')
 #endregion
 
 #region Catch the drag event and triggering the file selection function
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
-            if any(url.toLocalFile().endswith('.ui') for url in event.mimeData().urls()):
+            if any(url.toLocalFile().endswith('.ui') or os.path.isdir(url.toLocalFile())
+                   for url in event.mimeData().urls()):
                 event.acceptProposedAction()
             else:
                 event.ignore()
@@ -163,40 +468,34 @@ class MainWindow(QMainWindow):
             event.ignore()
             return
 
-        urls = event.mimeData().urls()
-        ui_files = [url.toLocalFile() for url in urls if url.toLocalFile().endswith('.ui')]
+        paths = [url.toLocalFile() for url in event.mimeData().urls()]
+        ui_files = [p for p in paths if p.endswith('.ui') and not os.path.isdir(p)]
+        folders = [p for p in paths if p and os.path.isdir(p)]
+
+        if folders:
+            self._start_scan(folders, ui_files)
+            event.acceptProposedAction()
+            return
 
         if not ui_files:
             self.ui.LblStatus.setText('No valid .ui files dropped')
             event.ignore()
             return
 
-        self.file_paths = ui_files
-        self.file_directory = os.path.dirname(ui_files[0])
-
-        if len(ui_files) == 1:
-            self.file_name = os.path.basename(ui_files[0])
-            self.file_path = ui_files[0]
-            self.ui.LblFileName.setText(self._norm(self.file_name))
-            self._refresh_output_row(set_default_name=True)
-            self._animate_list(hide=True)
-        else:
-            self.ui.LblFileName.setText(f"{len(ui_files)} files dropped")
-            self.ui.ListSelectedFiles.clear()
-            for f in ui_files:
-                self.ui.ListSelectedFiles.addItem(os.path.basename(f))
-            self._clear_output_row()
-            self._animate_list(show=True)
-
-        self.ui.LblDestinationName.setText(self._norm(self.file_directory))
+        self._set_selection(ui_files, "dropped")
         self.ui.LblStatus.setText('Files dropped and ready for conversion')
         event.acceptProposedAction()
 
 #endregion
 
-    def convert(self):
-        # Pre checks
-        if not self.file_paths or not all(os.path.isfile(f) for f in self.file_paths):
+    def convert(self, rows: list[int] | None = None):
+        """Convert every listed file, or only `rows`; pressed again while running, cancels."""
+        if self._queue is not None:
+            self.cancel_batch()
+            return
+
+        # Pre checks; the inputs themselves are checked as a batch below
+        if not self.file_paths:
             QMessageBox.warning(self, "Missing file", "Please select valid .ui files first.")
             self.ui.LblStatus.setText('Please select valid .ui files')
             return
@@ -206,59 +505,175 @@ class MainWindow(QMainWindow):
             self.ui.LblStatus.setText('Please select a valid destination folder')
             return
 
-        if not os.access(self.file_directory, os.W_OK):
-            self.ui.LblStatus.setText('No permission to write file')
-            return
+        from uiconvert import ConversionJob, Converter, JobQueue, output_name, resolve_backend
 
-        uic_path = shutil.which("pyside6-uic")
-        if not uic_path:
+        backend = resolve_backend()
+        if backend is None:
             self.ui.LblStatus.setText('pyside6-uic not found on PATH')
             QMessageBox.critical(self, "Tool missing", "pyside6-uic was not found. Make sure PySide6 tools are installed and on PATH.")
             return
 
-        # Prevent instant console opening and closing in Windows
-        startupinfo = None
-        creationflags = 0
-        if sys.platform.startswith("win"):
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            creationflags = subprocess.CREATE_NO_WINDOW
-
-        multiple = len(self.file_paths) > 1
-        errors = []
-
-        for file in self.file_paths:
-            fname = os.path.basename(file)
-            stem = Path(fname).stem
-            out_base = self.ui.EdBase.text().strip() if not multiple else f"ui_{stem}"
-            if out_base.lower().endswith('.py'):
-                out_base = out_base[:-3]
-
-            output_file = self._norm(os.path.join(self.file_directory, out_base + ".py"))
-
-            try:
-                subprocess.run(
-                    [uic_path, file, "-o", output_file],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
-                    startupinfo=startupinfo,
-                    creationflags=creationflags
-                )
-            except subprocess.CalledProcessError as e:
-                msg = (e.stderr or e.stdout or '').strip()
-                errors.append(f"{fname}: {msg}")
-            except Exception as e:
-                errors.append(f"{fname}: {str(e)}")
+        if self._scan_task is not None:
+            self.ui.LblStatus.setText('Still scanning for .ui files')
+            return
 
+        file_paths = self.file_paths
+        multiple = len(file_paths) > 1
+        base = self.ui.EdBase.text() if not multiple else None
+        if rows is None:
+            rows = list(range(len(file_paths)))
+        jobs = [ConversionJob(file_paths[row], self._norm(os.path.join(self.file_directory,
+                                                                        output_name(file_paths[row], base))))
+                for row in rows]
+
+        # The current and selected entries go first
+        view = self.ui.ListSelectedFiles
+        wanted = {rng_row for rng in view.selectionModel().selection() for rng_row in range(rng.top(), rng.bottom() + 1)}
+        if view.currentIndex().isValid():
+            wanted.add(view.currentIndex().row())
+        priorities = {i: 1 for i, row in enumerate(rows) if row in wanted}
+
+        self._batch_rows = rows
+        self._batch_jobs = jobs
+        self._queue = JobQueue(len(jobs), priorities)
+        self._batch_total = len(jobs)
+        self._batch_done = 0
+        self.files.set_states(rows, "queued")
+        self._set_batch_running(True)
+        self.ui.LblStatus.setText(f"Checking {self._batch_total} file(s)...")
+        self.pool.start(BatchTask(self._make_converter(backend, Converter), jobs, self._queue, self.conversion_signals))
+
+    def _on_preflight_failed(self, checks):
+        """The batch was refused before any uic process started; mark the offending entries."""
+        rows, jobs = self._batch_rows, self._batch_jobs
+        self._queue = None
+        self._batch_total = self._batch_done = 0
+        self.files.set_states(rows, "")
+        self._set_batch_running(False)
+
+        if checks.missing:
+            missing = set(checks.missing)
+            for row, job in zip(rows, jobs):
+                if job.src in missing:
+                    self.files.set_note(row, "File not found")
+            QMessageBox.warning(self, "Missing file", "Please select valid .ui files first.")
+            self.ui.LblStatus.setText('Please select valid .ui files')
+            return
+
+        if checks.unwritable:
+            self.ui.LblStatus.setText('No permission to write file')
+            return
+
+        collisions = checks.collisions
+        if collisions:
+            for row, job in zip(rows, jobs):
+                srcs = collisions.get(path_key(job.output))
+                if srcs:
+                    self.files.set_note(row, f"{os.path.basename(job.output)} is also written by another input")
+            names = sorted({os.path.basename(out) for out in collisions})
+            QMessageBox.warning(self, "Duplicate output names",
+                                "These output files would be written by more than one input:\n" + "\n".join(names))
+            self.ui.LblStatus.setText(f"{len(collisions)} output name collision(s)")
+            return
+
+        if checks.malformed:
+            failed = []
+            for row, job in zip(rows, jobs):
+                error = checks.malformed.get(job.src)
+                if error:
+                    self.files.set_note(row, error)
+                    failed.append(row)
+            self.files.set_states(failed, "failed")
+            QMessageBox.warning(self, "Invalid forms",
+                                "These files are not valid Designer forms; nothing was converted:\n"
+                                + "\n".join(os.path.basename(f) for f in checks.malformed))
+            self.ui.LblStatus.setText(f"{len(checks.malformed)} invalid .ui file(s)")
+
+    def _make_converter(self, backend, converter_cls):
+        """With UI2PY_DAEMON set, batches go to a running `ui2py --serve` daemon when one answers."""
+        if os.environ.get("UI2PY_DAEMON"):
+            from uiconvert.daemon import RemoteConverter, connect
+            client = connect()
+            if client is not None:
+                return RemoteConverter(client)
+        from uiconvert import DigestCache
+        from uiconvert.store import open_store
+        # Per-batch manifest and digest memos: the pre-flight check and the conversion share them
+        return converter_cls(backend, jobs=self.jobs, store=open_store(),  # shared cache from $UI2PY_CACHE
+                             manifest_cache={}, digests=DigestCache())
+
+    def cancel_batch(self, rows: list[int] | None = None):
+        """Cancel the running batch, or only the given list rows; running uic processes are stopped."""
+        if self._queue is None:
+            return
+        if rows is None:
+            self._queue.cancel()
+            self.ui.LblStatus.setText('Cancelling...')
+        else:
+            wanted = set(rows)
+            self._queue.cancel(i for i, row in enumerate(self._batch_rows) if row in wanted)
+
+    def prioritize_rows(self, rows: list[int]):
+        """Move pending list rows to the front of the running batch."""
+        if self._queue is not None:
+            wanted = set(rows)
+            self._queue.prioritize((i for i, row in enumerate(self._batch_rows) if row in wanted), 2)
+
+    def retry_failed(self):
+        rows = self.files.rows_in_state("failed")
+        if rows:
+            self.convert(rows)
+
+    def _on_file_started(self, index: int):
+        if index < len(self._batch_rows):
+            self.files.set_state(self._batch_rows[index], "running")
+        if self._batch_done == 0:
+            self.ui.LblStatus.setText(f"Converting 0/{self._batch_total}...")  # past the pre-flight checks
+
+    def _on_file_converted(self, result):
+        """Per-file completion coming back from the worker pool."""
+        if result.index >= len(self._batch_rows):
+            return
+        row = self._batch_rows[result.index]
+        self._batch_done += 1
+        if result.cancelled:
+            state, note = "cancelled", "Cancelled"
+        elif result.error:
+            state, note = "failed", result.error
+        elif result.up_to_date:
+            state, note = "up to date", "Up to date"
+        else:
+            state = f"done {result.uic_time * 1000:.0f} ms"
+            note = "Converted" if result.written else "Converted (unchanged)"
+        self.files.set_state(row, state)
+        self.files.set_note(row, note)
+        if self._batch_done < self._batch_total and self._queue is not None and not self._queue.all_cancelled:
+            self.ui.LblStatus.setText(f"Converting {self._batch_done}/{self._batch_total}...")
+
+    def _on_batch_finished(self, summary):
+        self._batch_done = self._batch_total
+        self._queue = None
+        self._set_batch_running(False)
+        self.last_summary = summary
+        self.ui.LblStatus.setToolTip("Right-click for the conversion report")
+        errors = summary.errors
         if errors:
-            self.ui.LblStatus.setText(f"{len(errors)} error(s) occurred. Check console.")
-            for err in errors:
-                print(err)
+            self.ui.LblStatus.setText(f"{len(errors)} error(s) occurred. Check console; right-click the list to retry.")
+            for r in errors:
+                print(f"{os.path.basename(r.job.src)}: {r.error}")
+        elif summary.cancelled:
+            self.ui.LblStatus.setText(f"Cancelled: {summary.up_to_date} up to date, {summary.rebuilt} rebuilt, "
+                                      f"{summary.cancelled} not converted")
         else:
-            self.ui.LblStatus.setText('Conversion completed')
+            self.ui.LblStatus.setText(f"Conversion completed: {summary.up_to_date} up to date, {summary.rebuilt} rebuilt")
+
+    def _set_batch_running(self, running: bool):
+        """Lock the inputs that would change the file list while a batch is in flight;
+        Convert turns into Cancel."""
+        for btn in (self.ui.BtnSelectFile, self.ui.BtnAddFolder, self.ui.BtnSelectDestinationFolder):
+            btn.setEnabled(not running)
+        self.ui.BtnConvert.setText("Cancel" if running else "Convert")
+        self.setAcceptDrops(not running)
 
     def select_file(self):
         files, _ = QFileDialog.getOpenFileNames(self, 'Select .ui files', '', 'UI Files (*.ui)')
@@ -267,29 +682,21 @@ class MainWindow(QMainWindow):
             self.ui.LblStatus.setText('No file selected')
             return
 
-        self.file_paths = [f for f in files if f.endswith('.ui')]
-        if not self.file_paths:
+        ui_files = [f for f in files if f.endswith('.ui')]
+        if not ui_files:
             self.ui.LblStatus.setText('No valid .ui files selected')
             return
 
-        self.ui.ListSelectedFiles.clear()
-        if len(self.file_paths) == 1:
-            self.file_path = self.file_paths[0]
-            self.file_name = os.path.basename(self.file_path)
-            self.ui.LblFileName.setText(self._norm(self.file_name))
-            self._refresh_output_row(set_default_name=True)
-            self._animate_list(hide=True)
-        else:
-            self.ui.LblFileName.setText(f"{len(self.file_paths)} files selected")
-            for f in self.file_paths:
-                self.ui.ListSelectedFiles.addItem(os.path.basename(f))
-            self._clear_output_row()
-            self._animate_list(show=True)
-
-        self.file_directory = os.path.dirname(self.file_paths[0])
-        self.ui.LblDestinationName.setText(self._norm(self.file_directory))
+        self._set_selection(ui_files, "selected")
         self.ui.LblStatus.setText('Files ready for conversion')
 
+    def add_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, 'Select a folder to scan for .ui files')
+        if not folder:
+            self.ui.LblStatus.setText('No folder selected')
+            return
+        self._start_scan([folder])
+
     def select_folder(self):
         self.file_directory = QFileDialog.getExistingDirectory(self, 'Select folder')
         if not self.file_directory:
@@ -303,44 +710,72 @@ class MainWindow(QMainWindow):
 
     # ------------------ delete file from list ------------------ 
     def remove_selected_files(self):
-        selected_items = self.ui.ListSelectedFiles.selectedItems()
-        if not selected_items:
+        rows = self._selected_rows()
+        if not rows or self._batch_done < self._batch_total or self._scan_task is not None:
             return
 
-        for item in selected_items:
-            row = self.ui.ListSelectedFiles.row(item)
-            file_name = item.text()
-            file_path = [f for f in self.file_paths if os.path.basename(f) == file_name]
-            if file_path:
-                self.file_paths.remove(file_path[0])
-            
-            self.ui.ListSelectedFiles.takeItem(row)
-            
-        new_count = len(self.file_paths)
+        self.files.remove_rows(rows)
+
+        new_count = self.files.rowCount()
+        self._show_selection("dropped")
         if new_count == 1:
-            self.ui.LblFileName.setText(self._norm(os.path.basename(self.file_paths[0])))
-            self.file_name = os.path.basename(self.file_paths[0])
-            self._refresh_output_row(set_default_name=True)
-            self._animate_list(hide=True)
             self.ui.LblStatus.setText('One file left, ready to convert')
         elif new_count == 0:
-            self.ui.LblFileName.setText(QCoreApplication.translate("MainWindow", u"File not selected yet", None))
             self.ui.LblStatus.setText(QCoreApplication.translate("MainWindow", u"Please select valid .ui files", None))
-            self._clear_output_row()
-            self._animate_list(hide=True)
         else:
-            self.ui.LblFileName.setText(f"{new_count} files dropped")
-            self.ui.LblStatus.setText(f"{len(selected_items)} file was deleted from the list.")
+            self.ui.LblStatus.setText(f"{len(rows)} file was deleted from the list.")
+
+    def _selected_rows(self) -> list[int]:
+        # Walk the selection ranges; QItemSelectionModel.selectedRows() is quadratic for scattered picks
+        return [row for rng in self.ui.ListSelectedFiles.selectionModel().selection()
+                for row in range(rng.top(), rng.bottom() + 1)]
 
     def show_list_context_menu(self, pos):
+        if not self.ui.ListSelectedFiles.indexAt(pos).isValid():
+            return
         menu = QMenu()
-        remove_action = menu.addAction("Remove Selected File")
-        
-        selected_item = self.ui.ListSelectedFiles.itemAt(pos)
-        if selected_item:
-            action = menu.exec(self.ui.ListSelectedFiles.viewport().mapToGlobal(pos))
-            if action == remove_action:
-                self.remove_selected_files()
+        running = self._queue is not None
+        first_action = cancel_action = retry_action = remove_action = None
+        if running:
+            first_action = menu.addAction("Convert Selected First")
+            cancel_action = menu.addAction("Cancel Selected")
+        else:
+            remove_action = menu.addAction("Remove Selected File")
+            if self.files.rows_in_state("failed"):
+                retry_action = menu.addAction("Retry Failed")
+
+        action = menu.exec(self.ui.ListSelectedFiles.viewport().mapToGlobal(pos))
+        if action is None:
+            return
+        if action == remove_action:
+            self.remove_selected_files()
+        elif action == first_action:
+            self.prioritize_rows(self._selected_rows())
+        elif action == cancel_action:
+            self.cancel_batch(self._selected_rows())
+        elif action == retry_action:
+            self.retry_failed()
+
+    def show_status_context_menu(self, pos):
+        if self.last_summary is None:
+            return
+        menu = QMenu()
+        show_action = menu.addAction("Show conversion report")
+        save_action = menu.addAction("Save conversion report...")
+        action = menu.exec(self.ui.LblStatus.mapToGlobal(pos))
+        if action == show_action:
+            from report_dialog import RunReportDialog
+            RunReportDialog(self.last_summary, self).exec()
+        elif action == save_action:
+            path, _ = QFileDialog.getSaveFileName(self, 'Save conversion report', 'ui2py-report.json',
+                                                  'JSON (*.json);;CSV (*.csv)')
+            if path:
+                from uiconvert.report import write_report
+                try:
+                    write_report(self.last_summary, path)
+                    self.ui.LblStatus.setText('Report saved')
+                except OSError as e:
+                    QMessageBox.warning(self, "Report", f"Could not write report:\n{e}")
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Delete or event.key() == Qt.Key.Key_Backspace:
@@ -351,32 +786,114 @@ class MainWindow(QMainWindow):
 
 
 
+    def warm_up(self):
+        """After the first frame: locate uic and query its version in the background,
+        so the first Convert click does not pay for it."""
+        def warm():
+            from uiconvert import resolve_backend
+            backend = resolve_backend()
+            if backend is not None:
+                backend.version()
+        if self._batch_done >= self._batch_total:
+            self.pool.start(warm)
+
     # ------------------ exit ------------------
     def exit(self):
         self.close()
 
+    def closeEvent(self, event):
+        # Cancel the running batch (pending files are dropped, running uic processes
+        # killed), so waiting for the worker is short however large the batch was
+        self._cancel_scan()
+        if self._queue is not None:
+            self._queue.cancel()
+        self.pool.clear()
+        self.pool.waitForDone()
+        super().closeEvent(event)
+
     def _norm(self, p: str) -> str:
         return os.path.normpath(p)
 
 # ------------------------------- main -------------------------------
+class StartupProbe(QObject):
+    """--startup-time: report how long it took to get the first frame on screen, then quit."""
+    def __init__(self, app: QApplication, marks: dict[str, float]):
+        super().__init__(app)
+        self.app = app
+        self.marks = marks
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and "first paint" not in self.marks:
+            self.marks["first paint"] = time.perf_counter()
+            QTimer.singleShot(0, self.report)
+        return False
+
+    def report(self):
+        previous = _T0
+        for name, t in self.marks.items():
+            print(f"{name:<14}{(t - previous) * 1000:8.1f} ms")
+            previous = t
+        print(f"{'total':<14}{(previous - _T0) * 1000:8.1f} ms (after interpreter start-up)")
+        self.app.quit()
+
+
+# Methods timed under their own names in --diagnostics mode
+TRACED_METHODS = ("convert", "_fit_to_text", "_animate_list", "_set_selection", "_show_selection",
+                  "_refresh_output_row", "_on_scan_chunk", "_on_file_converted", "_on_batch_finished")
+
+
+def _option_value(name: str) -> str | None:
+    """Value of `--name FILE` or `--name=FILE` on the command line."""
+    for i, arg in enumerate(sys.argv):
+        if arg.startswith(name + "="):
+            return arg.split("=", 1)[1]
+        if arg == name and i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return None
+
+
 def main():
-    app = QApplication(sys.argv)
+    marks = {"imports": time.perf_counter()}
+    measure_startup = "--startup-time" in sys.argv
+    trace_path = _option_value("--trace")
+    diagnostics = "--diagnostics" in sys.argv or trace_path is not None
+
+    if diagnostics:
+        import gui_diagnostics
+        gui_diagnostics.instrument(MainWindow, TRACED_METHODS)
+        app = gui_diagnostics.DiagnosticApplication(sys.argv)
+    else:
+        app = QApplication(sys.argv)
     load_qss(app, "system")
-    app.styleHints().colorSchemeChanged.connect(lambda _: load_qss(app, "system")) # for system change
     app.setQuitOnLastWindowClosed(True)
     app.setWindowIcon(QIcon(ICON_PATH))
+    marks["application"] = time.perf_counter()
 
-    window = MainWindow()
+    jobs = os.environ.get("UI2PY_JOBS", "")
+    window = MainWindow(jobs=int(jobs) if jobs.isdigit() else None)
     if sys.platform.startswith("win"):
+        import ctypes
         ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("ui2py.pyside6")
+    marks["main window"] = time.perf_counter()
+
+    if measure_startup:
+        window.installEventFilter(StartupProbe(app, marks))
+    if diagnostics:
+        gui_diagnostics.start(window, trace_path)
 
     window.show()
+    # Not needed for the first frame
+    QTimer.singleShot(0, lambda: app.styleHints().colorSchemeChanged.connect(lambda _: load_qss(app, "system")))
+    QTimer.singleShot(0, window.warm_up)
     sys.exit(app.exec())
 
 def rsrc(p: str) -> str:
     base = getattr(sys, "_MEIPASS", Path(__file__).parent)
     return str(Path(base) / "assets" / p)
 
+# Stylesheet text per file name, read from disk once
+_QSS_CACHE: dict[str, str] = {}
+
 def load_qss(app: QApplication, mode: str = "system"):
     if mode == "system":
         scheme = app.styleHints().colorScheme()
@@ -384,8 +901,13 @@ def load_qss(app: QApplication, mode: str = "system"):
     else:
         is_dark = (mode.lower() == "dark")
 
-    qss_path = Path(rsrc(f"styles/{'dark_style.qss' if is_dark else 'light_style.qss'}"))
-    app.setStyleSheet(qss_path.read_text(encoding="utf-8"))
+    name = 'dark_style.qss' if is_dark else 'light_style.qss'
+    if app.property("ui2py_qss") == name:
+        return  # already applied; setting it again would re-polish every widget
+    if name not in _QSS_CACHE:
+        _QSS_CACHE[name] = Path(rsrc(f"styles/{name}")).read_text(encoding="utf-8")
+    app.setStyleSheet(_QSS_CACHE[name])
+    app.setProperty("ui2py_qss", name)
 
 
 # OS-specific icon
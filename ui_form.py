@@ -8,17 +8,11 @@
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
 
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
-    QCursor, QFont, QFontDatabase, QGradient,
-    QIcon, QImage, QKeySequence, QLinearGradient,
-    QPainter, QPalette, QPixmap, QRadialGradient,
-    QTransform)
-from PySide6.QtWidgets import (QApplication, QHBoxLayout, QLabel, QLineEdit,
-    QListWidget, QListWidgetItem, QMainWindow, QPushButton,
-    QSizePolicy, QStatusBar, QWidget)
+from PySide6.QtCore import (QCoreApplication, QMetaObject, QRect, QSize,
+    Qt)
+from PySide6.QtGui import (QAction, QFont)
+from PySide6.QtWidgets import (QHBoxLayout, QLabel, QLineEdit, QListView,
+    QPushButton, QSizePolicy, QStatusBar, QWidget)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -48,6 +42,9 @@ class Ui_MainWindow(object):
         self.BtnExit = QPushButton(self.centralwidget)
         self.BtnExit.setObjectName(u"BtnExit")
         self.BtnExit.setGeometry(QRect(440, 140, 101, 31))
+        self.BtnAddFolder = QPushButton(self.centralwidget)
+        self.BtnAddFolder.setObjectName(u"BtnAddFolder")
+        self.BtnAddFolder.setGeometry(QRect(440, 20, 101, 31))
         self.BtnSelectDestinationFolder = QPushButton(self.centralwidget)
         self.BtnSelectDestinationFolder.setObjectName(u"BtnSelectDestinationFolder")
         self.BtnSelectDestinationFolder.setGeometry(QRect(30, 60, 111, 31))
@@ -101,7 +98,7 @@ class Ui_MainWindow(object):
 
         self.horizontalLayout_2.addWidget(self.EdSuffix)
 
-        self.ListSelectedFiles = QListWidget(self.centralwidget)
+        self.ListSelectedFiles = QListView(self.centralwidget)
         self.ListSelectedFiles.setObjectName(u"ListSelectedFiles")
         self.ListSelectedFiles.setGeometry(QRect(560, 10, 191, 151))
         MainWindow.setCentralWidget(self.centralwidget)
@@ -115,15 +112,20 @@ class Ui_MainWindow(object):
     # setupUi
 
     def retranslateUi(self, MainWindow):
-        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"MainWindow", None))
-        self.Exit.setText(QCoreApplication.translate("MainWindow", u"Exit", None))
-        self.BtnConvert.setText(QCoreApplication.translate("MainWindow", u"Convert", None))
-        self.BtnSelectFile.setText(QCoreApplication.translate("MainWindow", u"Select file", None))
-        self.LblFileName.setText(QCoreApplication.translate("MainWindow", u"File not selected yet", None))
-        self.label.setText(QCoreApplication.translate("MainWindow", u"Status  : ", None))
+        _translate = QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", u"MainWindow", None))
+        self.Exit.setText(_translate("MainWindow", u"Exit", None))
+        self.BtnConvert.setText(_translate("MainWindow", u"Convert", None))
+        self.BtnSelectFile.setText(_translate("MainWindow", u"Select file", None))
+        self.LblFileName.setText(_translate("MainWindow", u"File not selected yet", None))
+        self.label.setText(_translate("MainWindow", u"Status  : ", None))
         self.LblStatus.setText("")
-        self.BtnExit.setText(QCoreApplication.translate("MainWindow", u"Exit", None))
-        self.BtnSelectDestinationFolder.setText(QCoreApplication.translate("MainWindow", u"Destination Folder", None))
-        self.LblDestinationName.setText(QCoreApplication.translate("MainWindow", u"The file path is not selected. It will be the same directory as the selected File", None))
+        self.BtnExit.setText(_translate("MainWindow", u"Exit", None))
+#if QT_CONFIG(tooltip)
+        self.BtnAddFolder.setToolTip(_translate("MainWindow", u"Add every .ui file below a folder (respects .gitignore)", None))
+#endif // QT_CONFIG(tooltip)
+        self.BtnAddFolder.setText(_translate("MainWindow", u"Add folder", None))
+        self.BtnSelectDestinationFolder.setText(_translate("MainWindow", u"Destination Folder", None))
+        self.LblDestinationName.setText(_translate("MainWindow", u"The file path is not selected. It will be the same directory as the selected File", None))
     # retranslateUi
 
@@ -0,0 +1,39 @@
+"""GUI-free conversion helpers shared by the ui2py front ends.
+
+Names are resolved from their submodules on first access, so importing a single
+submodule (e.g. `uiconvert.filestore` from the GUI) stays cheap.
+"""
+import importlib
+
+_EXPORTS = {
+    "BACKENDS": "backends", "NativeBackend": "backends", "WrapperBackend": "backends",
+    "find_native_uic": "backends", "find_uic": "backends", "resolve_backend": "backends",
+    "RccBackend": "backends", "resolve_rcc": "backends",
+    "compile_output": "bundle", "write_bundle": "bundle",
+    "ConversionManifest": "cache", "DigestCache": "cache", "file_digest": "cache", "uic_version": "cache",
+    "DEFAULT_JOBS": "core", "BatchSummary": "core", "ConversionJob": "core", "Converter": "core",
+    "FileResult": "core", "make_jobs": "core", "output_collisions": "core", "output_name": "core",
+    "JobQueue": "core", "resource_jobs": "core",
+    "DependencyGraph": "deps", "parse_ui": "deps",
+    "DaemonClient": "daemon", "RemoteConverter": "daemon", "serve": "daemon",
+    "FileStore": "filestore", "path_key": "filestore",
+    "optimize_source": "optimize",
+    "PreflightReport": "preflight", "preflight": "preflight",
+    "Target": "targets", "parse_target": "targets", "stub_source": "targets",
+    "DirectoryStore": "store", "OutputStore": "store", "open_store": "store",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,125 @@
+"""Bytecode and bundle emission for generated forms.
+
+`compile_output` writes the regular `__pycache__` entry next to a generated module,
+so the first import skips compilation. `write_bundle` packs a batch of generated
+modules into one zip holding a package of precompiled modules; the package's
+`__init__` resolves `Ui_*` classes lazily, so only the forms actually used are
+unmarshalled:
+
+    sys.path.insert(0, "forms.zip")
+    from forms import Ui_MainWindow
+
+Resource modules (`<name>_rc`) go at the root of the zip, next to the package,
+because generated forms import them as top-level modules.
+
+Bundled bytecode is tied to the Python version that wrote it.
+"""
+import ast
+import importlib.util
+import io
+import marshal
+import os
+import py_compile
+import zipfile
+from typing import Iterable
+
+from .output import write_if_changed
+
+# Fixed entry timestamp so an unchanged batch produces an identical zip
+_ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+_LOADER = '''"""Qt Designer forms bundled by ui2py. Classes are imported on first access."""
+import importlib
+
+_CLASSES = {classes!r}
+
+__all__ = sorted(_CLASSES)
+
+
+def __getattr__(name):
+    module = _CLASSES.get(name)
+    if module is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(importlib.import_module(f".{{module}}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CLASSES))
+'''
+
+
+def compile_output(path: str, force: bool = False) -> bool:
+    """Write `path`'s `__pycache__` bytecode unless it is already newer than the source.
+    Returns True if it was (re)written."""
+    cfile = importlib.util.cache_from_source(path)
+    if not force:
+        try:
+            if os.path.getmtime(cfile) >= os.path.getmtime(path):
+                return False
+        except OSError:
+            pass
+    py_compile.compile(path, cfile=cfile, doraise=True)
+    return True
+
+
+def form_classes(source: str) -> list[str]:
+    """Top-level `Ui_*` class names defined by a generated module."""
+    return [node.name for node in ast.parse(source).body
+            if isinstance(node, ast.ClassDef) and node.name.startswith("Ui_")]
+
+
+def _pyc(source: bytes, filename: str) -> bytes:
+    """Unchecked hash-based pyc: valid without its source and independent of mtimes."""
+    code = compile(source, filename, "exec", dont_inherit=True)
+    flags = (0b01).to_bytes(4, "little")
+    return importlib.util.MAGIC_NUMBER + flags + importlib.util.source_hash(source) + marshal.dumps(code)
+
+
+def _add(archive: zipfile.ZipFile, name: str, data: bytes):
+    info = zipfile.ZipInfo(name, _ZIP_DATE)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    archive.writestr(info, data)
+
+
+def write_bundle(outputs: Iterable[str], zip_path: str, package: str | None = None,
+                 resources: Iterable[str] = ()) -> bool:
+    """Pack generated modules into `zip_path` as package `package` (default: the zip's stem).
+
+    A `Ui_*` class defined by several modules is exported from the first one only; the
+    others stay reachable through their module. `resources` are rcc outputs, stored as
+    top-level modules so the forms' `import <name>_rc` finds them. Returns True if the
+    zip changed.
+    """
+    package = package or os.path.splitext(os.path.basename(zip_path))[0]
+    if not package.isidentifier():
+        raise ValueError(f"{package!r} is not a valid package name")
+    modules: dict[str, bytes] = {}
+    classes: dict[str, str] = {}
+    for output in outputs:
+        module = os.path.splitext(os.path.basename(output))[0]
+        if module in modules:
+            raise ValueError(f"two outputs named {module}.py")
+        with open(output, "rb") as f:
+            source = f.read()
+        for name in form_classes(source.decode("utf-8")):
+            classes.setdefault(name, module)
+        modules[module] = source
+    rc_modules: dict[str, bytes] = {}
+    for output in resources:
+        module = os.path.splitext(os.path.basename(output))[0]
+        if module == package:
+            raise ValueError(f"resource module {module} clashes with the package name")
+        with open(output, "rb") as f:
+            rc_modules.setdefault(module, f.read())
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        loader = _LOADER.format(classes=dict(sorted(classes.items()))).encode("utf-8")
+        _add(archive, f"{package}/__init__.pyc", _pyc(loader, f"{package}/__init__.py"))
+        for module, source in sorted(modules.items()):
+            _add(archive, f"{package}/{module}.pyc", _pyc(source, f"{package}/{module}.py"))
+        for module, source in sorted(rc_modules.items()):
+            _add(archive, f"{module}.pyc", _pyc(source, f"{module}.py"))
+    return write_if_changed(zip_path, buffer.getvalue())
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+from functools import lru_cache
+
+from .filestore import path_key
+from .output import discard, temp_output_path
+
+
+MANIFEST_NAME = ".ui2py-manifest.json"
+MANIFEST_VERSION = 1
+_ENTRY_FIELDS = ("hash", "uic", "output")  # all strings in a valid entry
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of the file contents."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class DigestCache:
+    """Memoised `file_digest` for long-running processes, keyed on path, mtime and size;
+    a file is only re-hashed after it was modified."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[tuple[int, int], str]] = {}
+
+    def digest(self, path: str) -> str:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = path_key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        digest = file_digest(path)
+        with self._lock:
+            self._entries[key] = (stamp, digest)
+        return digest
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _mtime_ns(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def uic_version(uic_path: str) -> str:
+    """Version string reported by the uic tool (cached per executable)."""
+    kwargs = {}
+    if sys.platform.startswith("win"):
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+    try:
+        proc = subprocess.run([uic_path, "--version"], capture_output=True, text=True,
+                              encoding="utf-8", errors="replace", **kwargs)
+    except OSError:
+        return ""
+    return (proc.stdout or proc.stderr).strip()
+
+
+class ConversionManifest:
+    """Persistent record of converted files, stored next to the generated output.
+
+    Each entry is keyed on the absolute input path and remembers the content hash,
+    the uic version and the output path of the last successful conversion. A file
+    whose three values still match (and whose output still exists) is up to date.
+    """
+
+    def __init__(self, directory: str, entries: dict | None = None):
+        self.directory = directory
+        self.entries: dict[str, dict] = entries or {}
+        self._dirty = False
+        self._stamp = _mtime_ns(self.path)  # manifest file as last read or written
+
+    def is_fresh(self) -> bool:
+        """False once another process rewrote (or removed) the manifest file."""
+        return _mtime_ns(self.path) == self._stamp
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    @classmethod
+    def load(cls, directory: str) -> "ConversionManifest":
+        path = os.path.join(directory, MANIFEST_NAME)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(directory)
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return cls(directory)
+        files = data.get("files")
+        if not isinstance(files, dict):
+            return cls(directory)
+        # A damaged entry only means that file is rebuilt
+        return cls(directory, {src: entry for src, entry in files.items()
+                               if isinstance(entry, dict) and all(isinstance(entry.get(k), str) for k in _ENTRY_FIELDS)})
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return path_key(path)
+
+    def is_current(self, src: str, output: str, digest: str, version: str) -> bool:
+        entry = self.entries.get(self._key(src))
+        return (entry is not None
+                and entry.get("hash") == digest
+                and entry.get("uic") == version
+                and entry.get("output") == self._key(output)
+                and os.path.isfile(output))
+
+    def record(self, src: str, output: str, digest: str, version: str):
+        self.entries[self._key(src)] = {"hash": digest, "uic": version, "output": self._key(output)}
+        self._dirty = True
+
+    def forget(self, src: str):
+        if self.entries.pop(self._key(src), None) is not None:
+            self._dirty = True
+
+    def save(self):
+        """Write the manifest atomically; no-op when nothing changed."""
+        if not self._dirty:
+            return
+        tmp = temp_output_path(self.path)  # two processes saving one folder's manifest must not share it
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "files": self.entries}, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except BaseException:
+            discard(tmp)
+            raise
+        self._dirty = False
+        self._stamp = _mtime_ns(self.path)
@@ -0,0 +1,262 @@
+"""Headless batch conversion: python -m uiconvert --out DIR --jobs N paths/globs..."""
+import argparse
+import glob
+import os
+import sys
+
+from .backends import BACKENDS, resolve_backend, resolve_rcc
+from .bundle import write_bundle
+from .cache import DigestCache
+from .core import ERROR_BUDGET, Converter, make_jobs
+from .daemon import ENV_ADDRESS
+from .deps import DependencyGraph
+from .filestore import path_key
+from .optimize import DEFAULT_PASSES, PASSES, parse_passes
+from .preflight import preflight
+from .report import write_report
+from .scan import glob_ui_files, iter_ui_files
+from .targets import parse_target
+from .store import DEFAULT_MAX_AGE, DEFAULT_MAX_BYTES, STORE_ENV, open_store
+
+
+def expand_inputs(patterns: list[str]) -> list[str]:
+    """Resolve files, directories (searched recursively) and glob patterns to unique .ui paths.
+    Symlinked directories are not followed, so a link cycle cannot hang the search."""
+    seen: dict[str, None] = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(iter_ui_files(pattern, use_ignore_files=False))
+        elif glob.has_magic(pattern):
+            matches = sorted(glob_ui_files(pattern))
+        else:
+            matches = [pattern]
+        for m in matches:
+            if m.endswith(".ui"):
+                seen.setdefault(os.path.normpath(m), None)
+    return list(seen)
+
+
+def print_deps(files: list[str]):
+    graph = DependencyGraph()
+    for f in files:
+        deps = graph.add_form(f)
+        print(f)
+        for qrc in deps.resources:
+            print(f"  resource {qrc}")
+            for path in graph.resources.get(path_key(qrc), []):
+                print(f"    file {path}")
+        for cls, header in deps.custom_widgets.items():
+            print(f"  widget {cls} ({header})")
+        for module in deps.modules:
+            print(f"  module {module}")
+
+
+def daemon_control(stop: bool) -> int:
+    from .daemon import connect
+    client = connect()
+    if client is None:
+        print("ui2py: no daemon running", file=sys.stderr)
+        return 1
+    with client:
+        reply = client.shutdown() if stop else client.status()
+    if not stop:
+        for key, value in reply.items():
+            if key != "event":
+                print(f"{key}: {value}")
+    return 0
+
+
+def serve_daemon(args) -> int:
+    from .daemon import serve
+    backend = resolve_backend(args.backend, args.uic)
+    if backend is None:
+        print("ui2py: pyside6-uic not found on PATH", file=sys.stderr)
+        return 2
+    return serve(backend, jobs=args.jobs, store=shared_store(args), ready=lambda address: print(f"ui2py daemon listening on {address}", flush=True))
+
+
+def shared_store(args):
+    return open_store(args.cache, args.cache_size << 20, args.cache_age * 86400) if args.cache else None
+
+
+def remote_converter(args, passes):
+    """A RemoteConverter for a running daemon, or None to convert in this process."""
+    from .daemon import RemoteConverter, connect
+    client = connect()
+    if client is None:
+        if args.verbose:
+            print("ui2py: no daemon running, converting locally", file=sys.stderr)
+        return None
+    return RemoteConverter(client, force=args.force, optimize=passes, bytecode=args.bytecode, resources=args.resources,
+                           targets=args.target)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="ui2py", description="Convert Qt Designer .ui files to Python with pyside6-uic.")
+    parser.add_argument("paths", nargs="*", help=".ui files, directories or glob patterns")
+    parser.add_argument("-o", "--out", metavar="DIR", help="output directory (default: next to each input)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, metavar="N", help="parallel conversions (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="ignore the manifest and rebuild everything")
+    parser.add_argument("--backend", choices=BACKENDS, default="auto",
+                        help="native: PySide6's bundled uic binary; pyside6-uic: the wrapper on PATH (default: auto)")
+    parser.add_argument("--uic", metavar="PATH", help="pyside6-uic compatible executable (overrides --backend)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every converted file")
+    parser.add_argument("--stream", action="store_true",
+                        help="print uic's diagnostics as they are produced instead of once a file has failed")
+    parser.add_argument("--error-budget", type=int, default=ERROR_BUDGET // 1024, metavar="KIB",
+                        help=f"error text kept for the whole batch; later errors keep their first line only "
+                             f"(default: {ERROR_BUDGET // 1024})")
+    parser.add_argument("--cache", metavar="DIR", default=os.environ.get(STORE_ENV),
+                        help=f"shared, content-addressed cache of generated forms, e.g. on a network drive or CI "
+                             f"cache volume (default: ${STORE_ENV})")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_BYTES >> 20, metavar="MIB",
+                        help=f"evict least recently used entries beyond this size (default: {DEFAULT_MAX_BYTES >> 20})")
+    parser.add_argument("--cache-age", type=float, default=DEFAULT_MAX_AGE / 86400, metavar="DAYS",
+                        help=f"evict entries unused for this long (default: {DEFAULT_MAX_AGE // 86400:.0f})")
+    parser.add_argument("--no-xml-check", action="store_true",
+                        help="skip the well-formedness scan of every form before conversion starts")
+    parser.add_argument("--report", metavar="FILE",
+                        help="write per-file timings and batch totals (.csv for CSV, otherwise JSON)")
+    parser.add_argument("--optimize", action="store_true",
+                        help=f"post-process the generated code with the default passes ({','.join(DEFAULT_PASSES)})")
+    parser.add_argument("--optimize-passes", metavar="PASSES",
+                        help=f"post-process with these passes instead, comma separated from {', '.join(PASSES)}")
+    parser.add_argument("--target", action="append", default=[], metavar="KIND[:DIR]",
+                        help="also write an artifact per form from the same uic run: pyi (type stub next to the "
+                             "output, or in DIR) or py:DIR (a copy in DIR); repeatable")
+    parser.add_argument("--bytecode", action="store_true", help="also write each output's __pycache__ bytecode")
+    parser.add_argument("--bundle", metavar="ZIP",
+                        help="pack the generated modules into an importable zip (package named after the file)")
+    parser.add_argument("--resources", action="store_true",
+                        help="compile the .qrc files the forms include with rcc (<name>_rc.py next to the output)")
+    parser.add_argument("--deps", action="store_true", help="print each form's dependencies and exit")
+    parser.add_argument("-w", "--watch", action="store_true",
+                        help="treat paths as project directories and rebuild .ui files as they are saved")
+    daemon = parser.add_argument_group("daemon", f"a resident converter on a local socket (address: ${ENV_ADDRESS} "
+                                                 "or a per-user default)")
+    daemon.add_argument("--serve", action="store_true", help="run the conversion daemon in the foreground")
+    daemon.add_argument("--daemon", action="store_true",
+                        help="hand the batch to a running daemon; converts locally when none is running")
+    daemon.add_argument("--daemon-status", action="store_true", help="print the running daemon's status and exit")
+    daemon.add_argument("--daemon-stop", action="store_true", help="stop the running daemon")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        passes = (parse_passes(args.optimize_passes) if args.optimize_passes is not None
+                  else DEFAULT_PASSES if args.optimize else ())
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        targets = tuple(parse_target(spec) for spec in args.target)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.bundle and args.watch:
+        parser.error("--bundle cannot be combined with --watch")
+    if args.daemon_status or args.daemon_stop:
+        return daemon_control(args.daemon_stop)
+    if args.serve:
+        return serve_daemon(args)
+    if not args.paths:
+        parser.error("no input paths given")
+
+    if args.watch:
+        files = []
+        missing = [p for p in args.paths if not os.path.isdir(p)]
+        for p in missing:
+            print(f"ui2py: not a directory: {p}", file=sys.stderr)
+        if missing:
+            return 2
+    else:
+        files = expand_inputs(args.paths)
+        if not files:
+            print("ui2py: no .ui files matched", file=sys.stderr)
+            return 2
+
+    if args.deps:
+        print_deps(files or expand_inputs(args.paths))
+        return 0
+
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        if not os.access(args.out, os.W_OK):
+            print(f"ui2py: no permission to write to {args.out}", file=sys.stderr)
+            return 2
+
+    for target in targets:
+        if target.directory:
+            os.makedirs(target.directory, exist_ok=True)
+
+    backend = resolve_backend(args.backend, args.uic)
+    if backend is None:
+        print("ui2py: pyside6-uic not found on PATH", file=sys.stderr)
+        return 2
+    rcc = None
+    if args.resources:
+        rcc = resolve_rcc()
+        if rcc is None:
+            print("ui2py: pyside6-rcc not found on PATH", file=sys.stderr)
+            return 2
+
+    def stream(job, line):
+        print(f"{job.src}: {line}", file=sys.stderr, flush=True)
+
+    def report(result):
+        if result.error and args.stream and result.exit_status > 0:
+            print(f"{result.job.src}: failed with exit status {result.exit_status}", file=sys.stderr)
+        elif result.error:
+            print(f"{result.job.src}: {result.error}", file=sys.stderr)
+        elif args.verbose or (args.watch and not result.up_to_date):
+            state = "up to date" if result.up_to_date else "from cache" if result.cache == "shared" else "converted"
+            print(f"{result.job.src} -> {result.job.output} ({state})", flush=True)
+
+    converter = remote_converter(args, passes) if args.daemon and not args.watch else None
+    if converter is None:
+        converter = Converter(backend, jobs=args.jobs, force=args.force, optimize=passes, bytecode=args.bytecode,
+                              rcc=rcc, on_output=stream if args.stream else None,
+                              error_budget=max(0, args.error_budget) * 1024, store=shared_store(args),
+                              targets=targets, manifest_cache={}, digests=DigestCache())
+    if args.watch:
+        from .watch import run_watch
+        return run_watch(args.paths, converter, args.out, on_result=report)
+
+    # A daemon checks the forms itself; locally, forms the manifest vouches for are not re-read
+    jobs = make_jobs(files, args.out)
+    local = isinstance(converter, Converter)
+    checks = preflight(jobs, check_xml=local and not args.no_xml_check, targets=targets,
+                       current=converter.is_current if local else None)
+    if not checks.ok:
+        for message in checks.messages():
+            print(f"ui2py: {message}", file=sys.stderr)
+        print("ui2py: nothing converted", file=sys.stderr)
+        return 2 if checks.missing or checks.unwritable or checks.collisions else 1
+
+    try:
+        summary = converter.convert(jobs, on_result=report)
+    except (ConnectionError, RuntimeError) as e:  # only raised by the daemon client
+        print(f"ui2py: daemon: {e}", file=sys.stderr)
+        return 1
+    print(f"{summary.up_to_date} up to date, {summary.rebuilt} rebuilt ({summary.written} written), {len(summary.errors)} failed "
+          f"in {summary.wall_time:.2f} s ({summary.throughput:.1f} files/s)")
+    if args.report:
+        try:
+            write_report(summary, args.report)
+        except OSError as e:
+            print(f"ui2py: could not write report: {e}", file=sys.stderr)
+            return 1
+    if args.bundle:
+        if summary.errors:
+            print(f"ui2py: {args.bundle} not written because of failed conversions", file=sys.stderr)
+        else:
+            try:
+                changed = write_bundle([r.job.output for r in summary.results if r.kind == "ui"], args.bundle,
+                                       resources=[r.job.output for r in summary.results if r.kind == "qrc"])
+            except (OSError, SyntaxError, ValueError) as e:
+                print(f"ui2py: could not write bundle: {e}", file=sys.stderr)
+                return 1
+            if args.verbose:
+                print(f"{args.bundle} {'written' if changed else 'unchanged'}")
+    return 1 if summary.errors else 0
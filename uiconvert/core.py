@@ -0,0 +1,423 @@
+import heapq
+import os
+import py_compile
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterable
+
+from .backends import ERROR_LIMIT, RccBackend, WrapperBackend
+from .bundle import compile_output
+from .cache import ConversionManifest, DigestCache, file_digest
+from .deps import parse_ui, rc_output_name, resource_digest
+from .filestore import path_key
+from .optimize import optimize_file
+from .output import commit_output, discard, temp_output_path, write_if_changed
+from .store import OutputStore, output_key
+from .targets import Target, write_targets
+
+
+# Number of pyside6-uic processes run at the same time
+DEFAULT_JOBS = os.cpu_count() or 1
+
+# Characters of error text a batch keeps across all its results; once spent, further
+# errors keep only their first line. With the per-file ERROR_LIMIT and at most
+# 2 x jobs files in flight, a batch's memory does not grow with its size.
+ERROR_BUDGET = 1 << 20
+ERROR_LINE = 200
+
+
+@dataclass(slots=True)
+class ConversionJob:
+    src: str
+    output: str
+
+
+@dataclass(slots=True)
+class FileResult:
+    index: int
+    job: ConversionJob
+    error: str = ""
+    up_to_date: bool = False
+    digest: str = ""
+    # Telemetry (seconds / bytes)
+    queue_wait: float = 0.0
+    uic_time: float = 0.0
+    input_size: int = 0
+    output_size: int = 0
+    cache: str = "off"    # "hit" (manifest), "shared" (from the shared store), "miss" or "off"
+    written: bool = False  # output replaced; False when uic produced identical bytes
+    exit_status: int = 0  # uic exit code; -1 if it could not be started
+    kind: str = "ui"      # "ui" for forms, "qrc" for resource collections compiled with rcc
+    resources: list[str] = field(default_factory=list)  # .qrc files a form includes
+    cancelled: bool = False  # dropped from the queue or stopped while uic ran; output untouched
+    targets: list[str] = field(default_factory=list)  # extra artifacts derived from the output
+
+    @property
+    def ok(self) -> bool:
+        return not self.error and not self.cancelled
+
+
+@dataclass
+class BatchSummary:
+    results: list[FileResult] = field(default_factory=list)
+    backend: str = ""
+    jobs: int = 0
+    started_at: float = 0.0  # wall clock (time.time)
+    wall_time: float = 0.0
+
+    @property
+    def written(self) -> int:
+        return sum(1 for r in self.results if r.written)
+
+    @property
+    def throughput(self) -> float:
+        """Files per second over the whole batch."""
+        return len(self.results) / self.wall_time if self.wall_time > 0 else 0.0
+
+    @property
+    def errors(self) -> list[FileResult]:
+        return [r for r in self.results if r.error]
+
+    @property
+    def cancelled(self) -> int:
+        return sum(1 for r in self.results if r.cancelled)
+
+    @property
+    def up_to_date(self) -> int:
+        return sum(1 for r in self.results if r.up_to_date)
+
+    @property
+    def rebuilt(self) -> int:
+        return sum(1 for r in self.results if r.ok and not r.up_to_date)
+
+
+def output_name(src: str, base: str | None = None) -> str:
+    """Output file name for `src`: `ui_<stem>.py`, or `base` (with or without .py) when given."""
+    out_base = (base or "").strip() or f"ui_{Path(src).stem}"
+    if out_base.lower().endswith('.py'):
+        out_base = out_base[:-3]
+    return out_base + ".py"
+
+
+def make_jobs(files: Iterable[str], out_dir: str | None = None) -> list[ConversionJob]:
+    """One job per input, written to `out_dir` or next to the input."""
+    return [ConversionJob(f, os.path.normpath(os.path.join(out_dir or os.path.dirname(f), output_name(f))))
+            for f in files]
+
+
+def output_collisions(jobs: Iterable[ConversionJob]) -> dict[str, list[str]]:
+    """Output paths claimed by more than one input."""
+    claimed: dict[str, list[str]] = {}
+    for job in jobs:
+        claimed.setdefault(path_key(job.output), []).append(job.src)
+    return {out: srcs for out, srcs in claimed.items() if len(srcs) > 1}
+
+
+class JobQueue:
+    """Pending jobs of one batch (by index), highest priority first, then in order.
+
+    Workers take the next index only when they become free, so priority changes
+    and cancellations made from another thread (the GUI) apply to every job that
+    has not started. Cancelling a running job makes its backend kill the tool.
+    """
+
+    def __init__(self, count: int, priorities: dict[int, int] | None = None):
+        self._lock = threading.Lock()
+        self._priority = {i: (priorities or {}).get(i, 0) for i in range(count)}  # pending only
+        self._heap = [(-p, i) for i, p in self._priority.items()]
+        heapq.heapify(self._heap)
+        self._cancelled: set[int] = set()
+        self._cancel_log: list[int] = []  # the same indexes in the order they were cancelled
+        self.all_cancelled = False
+
+    def take(self) -> int | None:
+        with self._lock:
+            while self._heap:
+                neg, index = heapq.heappop(self._heap)
+                if self._priority.get(index) == -neg:  # skip entries superseded by prioritize()
+                    del self._priority[index]
+                    return index
+        return None
+
+    def prioritize(self, indexes: Iterable[int], priority: int):
+        with self._lock:
+            for index in indexes:
+                if index in self._priority and self._priority[index] != priority:
+                    self._priority[index] = priority
+                    heapq.heappush(self._heap, (-priority, index))
+
+    def cancel(self, indexes: Iterable[int] | None = None):
+        """Cancel the given jobs, or all of them."""
+        with self._lock:
+            if indexes is None:
+                self.all_cancelled = True
+            else:
+                for index in indexes:
+                    if index not in self._cancelled:
+                        self._cancelled.add(index)
+                        self._cancel_log.append(index)
+
+    def cancelled_since(self, mark: int = 0) -> tuple[list[int], int]:
+        """Indexes cancelled individually since `mark`, and the mark to pass next time.
+        Costs only the new cancellations, so it can be polled per event."""
+        with self._lock:
+            return self._cancel_log[mark:], len(self._cancel_log)
+
+    def is_cancelled(self, index: int) -> bool:
+        return self.all_cancelled or index in self._cancelled
+
+
+def resource_jobs(results: Iterable[FileResult]) -> list[ConversionJob]:
+    """One rcc job per .qrc included by a converted form, written next to that form's output."""
+    jobs: dict[str, ConversionJob] = {}
+    for result in results:
+        if result.ok:
+            out_dir = os.path.dirname(result.job.output)
+            for qrc in result.resources:
+                output = os.path.join(out_dir, rc_output_name(qrc))
+                jobs.setdefault(path_key(output), ConversionJob(qrc, output))
+    return list(jobs.values())
+
+
+class Converter:
+    """Converts batches of .ui files on a bounded thread pool.
+
+    Workers only hash inputs and run uic; manifests are read and updated in the
+    thread that called `convert`, so callbacks and bookkeeping stay single-threaded.
+    With an `rcc` backend, the .qrc files the forms include are compiled once the
+    forms are done; they are rebuilt when the .qrc or any file it lists changes.
+    With a `store`, forms missing from the manifest are first looked up there, and
+    whatever uic generates is added to it.
+    """
+
+    def __init__(self, backend: WrapperBackend, jobs: int | None = None, use_cache: bool = True, force: bool = False,
+                 optimize: tuple[str, ...] = (), bytecode: bool = False, rcc: RccBackend | None = None,
+                 manifest_cache: dict[str, ConversionManifest] | None = None, digests: DigestCache | None = None,
+                 on_output: Callable[[ConversionJob, str], None] | None = None,
+                 error_limit: int = ERROR_LIMIT, error_budget: int = ERROR_BUDGET, store: OutputStore | None = None,
+                 targets: tuple[Target, ...] = ()):
+        self.backend = backend
+        self.jobs = max(1, jobs or DEFAULT_JOBS)
+        self.use_cache = use_cache
+        self.force = force  # rebuild everything, but still refresh the manifest
+        self.optimize = tuple(optimize)  # uiconvert.optimize passes run on uic's output
+        self.bytecode = bytecode  # also keep each output's __pycache__ entry current
+        self.rcc = rcc
+        # Long-running hosts keep manifests and input digests in memory between batches
+        self.manifest_cache = manifest_cache
+        self.digests = digests
+        # Tool output is streamed line by line to `on_output` (from worker threads) and
+        # capped per file and per batch in what the results keep
+        self.on_output = on_output
+        self.error_limit = error_limit
+        self.error_budget = error_budget
+        self.store = store  # shared, content-addressed outputs (uiconvert.store)
+        self.targets = tuple(targets)  # further artifacts per form, derived from the one uic run
+
+    def build_key(self) -> str:
+        """What the manifest records as the generator: uic version plus optimizer passes."""
+        version = self.backend.version()
+        return f"{version} +optimize={','.join(self.optimize)}" if self.optimize else version
+
+    def _convert_one(self, index: int, job: ConversionJob, manifest: ConversionManifest | None,
+                     version: str, submitted: float, kind: str = "ui",
+                     cancelled: Callable[[], bool] | None = None) -> FileResult:
+        result = FileResult(index, job, queue_wait=time.perf_counter() - submitted,
+                            cache="off" if manifest is None else "miss", kind=kind)
+        backend = self.backend if kind == "ui" else self.rcc
+        try:
+            result.input_size = os.path.getsize(job.src)
+            if kind != "ui":
+                result.digest = resource_digest(job.src)
+            else:
+                result.digest = self.digests.digest(job.src) if self.digests is not None else file_digest(job.src)
+        except (OSError, ET.ParseError) as e:
+            result.error, result.exit_status = str(e), -1
+            return result
+        if kind == "ui" and self.rcc is not None:
+            try:
+                result.resources = parse_ui(job.src).resources
+            except ET.ParseError:
+                pass  # uic reports the broken XML
+        if manifest is not None and not self.force and manifest.is_current(job.src, job.output, result.digest, version):
+            result.up_to_date, result.cache = True, "hit"
+        elif kind == "ui" and self._fetch(result, version):
+            pass
+        else:
+            tmp = temp_output_path(job.output)
+            start = time.perf_counter()
+            on_output = partial(self.on_output, job) if self.on_output is not None else None
+            result.exit_status, result.error = backend.convert(job.src, tmp, cancelled, on_output, self.error_limit)
+            result.uic_time = time.perf_counter() - start
+            if cancelled is not None and cancelled():
+                discard(tmp)
+                result.cancelled, result.error, result.exit_status = True, "", 0
+                return result
+            if not result.error and self.optimize and kind == "ui":
+                try:
+                    optimize_file(tmp, self.optimize)
+                except (OSError, SyntaxError, ValueError) as e:
+                    result.error = f"optimizer: {e}"
+            if result.error:
+                discard(tmp)
+            else:
+                try:
+                    result.written = commit_output(tmp, job.output)
+                except OSError as e:
+                    discard(tmp)
+                    result.error = str(e)
+            if not result.error and kind == "ui" and self.store is not None:
+                self._share(result, version)
+        if not result.error:
+            try:
+                result.output_size = os.path.getsize(job.output)
+            except OSError:
+                pass
+        if not result.error and kind == "ui" and self.targets:
+            try:
+                result.targets = write_targets(job.src, job.output, self.targets, refresh=not result.up_to_date)
+            except (OSError, SyntaxError, ValueError, ET.ParseError) as e:
+                result.error = f"targets: {e}"
+        if not result.error and self.bytecode:
+            try:
+                compile_output(job.output, force=result.written)
+            except (OSError, py_compile.PyCompileError) as e:
+                result.error = f"bytecode: {e}"
+        return result
+
+    def _fetch(self, result: FileResult, version: str) -> bool:
+        """Take the output from the shared store instead of running uic; False on a miss."""
+        if self.store is None or self.force:
+            return False
+        try:
+            data = self.store.get(output_key(result.digest, version, result.job.src))
+        except OSError:
+            data = None  # an unreachable cache only costs the conversion
+        if data is None:
+            return False
+        result.cache = "shared"
+        try:
+            result.written = write_if_changed(result.job.output, data)
+        except OSError as e:
+            result.error = str(e)
+        return True
+
+    def _share(self, result: FileResult, version: str):
+        try:
+            with open(result.job.output, "rb") as f:
+                self.store.put(output_key(result.digest, version, result.job.src), f.read())
+        except OSError as e:
+            print(f"Could not add {result.job.output} to the shared cache: {e}", file=sys.stderr)
+
+    def is_current(self, job: ConversionJob) -> bool:
+        """Whether the manifest already vouches for `job`'s output. Pass `manifest_cache` and
+        `digests` when calling this before `convert`, so neither is read twice."""
+        if self.force or not self.use_cache:
+            return False
+        try:
+            digest = self.digests.digest(job.src) if self.digests is not None else file_digest(job.src)
+        except OSError:
+            return False
+        manifest = self._load_manifest(os.path.dirname(os.path.abspath(job.output)))
+        return manifest.is_current(job.src, job.output, digest, self.build_key())
+
+    def _load_manifest(self, out_dir: str) -> ConversionManifest:
+        if self.manifest_cache is None:
+            return ConversionManifest.load(out_dir)
+        manifest = self.manifest_cache.get(out_dir)
+        if manifest is None or not manifest.is_fresh():
+            manifest = self.manifest_cache[out_dir] = ConversionManifest.load(out_dir)
+        return manifest
+
+    def _run_next(self, queue: JobQueue, batch: list[ConversionJob], offset: int, manifest_for, version: str,
+                  submitted: float, kind: str, on_start) -> FileResult:
+        """Worker body: convert whichever job of `batch` is first in `queue` now."""
+        index = queue.take()
+        job = batch[index]
+        if queue.is_cancelled(index):
+            return FileResult(offset + index, job, queue_wait=time.perf_counter() - submitted, kind=kind, cancelled=True)
+        if on_start is not None:
+            on_start(offset + index)
+        return self._convert_one(offset + index, job, manifest_for(job), version, submitted, kind,
+                                 lambda: queue.is_cancelled(index))
+
+    def convert(self, jobs: list[ConversionJob],
+                on_result: Callable[[FileResult], None] | None = None,
+                on_start: Callable[[int], None] | None = None,
+                queue: JobQueue | None = None) -> BatchSummary:
+        """Convert `jobs`; `on_start(index)` and `on_result(result)` are called from worker
+        and calling thread respectively. Pass a `JobQueue` to reorder or cancel while running."""
+        version = self.build_key()
+        rcc_version = self.rcc.version() if self.rcc is not None else ""
+        manifests: dict[str, ConversionManifest] = {}
+        if self.use_cache:
+            for job in jobs:
+                out_dir = os.path.dirname(os.path.abspath(job.output))
+                if out_dir not in manifests:
+                    manifests[out_dir] = self._load_manifest(out_dir)
+
+        def manifest_for(job):
+            return manifests.get(os.path.dirname(os.path.abspath(job.output)))
+
+        summary = BatchSummary(backend=self.backend.name, jobs=self.jobs, started_at=time.time())
+        batch_start = time.perf_counter()
+
+        budget = self.error_budget
+
+        def keep_error(result):
+            nonlocal budget
+            if len(result.error) > budget:
+                first = result.error.partition("\n")[0][:ERROR_LINE]
+                result.error = first + " (further output dropped: batch error budget spent)"
+            budget = max(0, budget - len(result.error))
+
+        def run(pool, batch, queue, kind, version):
+            # At most 2 x jobs tasks in flight, so a huge batch does not queue one future per file
+            offset, submitted, window = len(summary.results), time.perf_counter(), 2 * self.jobs
+            todo, pending = len(batch), set()
+            while todo or pending:
+                while todo and len(pending) < window:
+                    pending.add(pool.submit(self._run_next, queue, batch, offset, manifest_for, version,
+                                            submitted, kind, on_start))
+                    todo -= 1
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result.error:
+                        keep_error(result)
+                    manifest = manifest_for(result.job)
+                    if manifest is not None and not result.cancelled:
+                        if result.error:
+                            manifest.forget(result.job.src)
+                        elif not result.up_to_date:
+                            manifest.record(result.job.src, result.job.output, result.digest, version)
+                    summary.results.append(result)
+                    if on_result is not None:
+                        on_result(result)
+
+        queue = queue or JobQueue(len(jobs))
+        with ThreadPoolExecutor(max_workers=min(self.jobs, max(1, len(jobs)))) as pool:
+            run(pool, jobs, queue, "ui", version)
+            if self.rcc is not None and not queue.all_cancelled:
+                rc_jobs = resource_jobs(summary.results)
+                run(pool, rc_jobs, JobQueue(len(rc_jobs)), "qrc", rcc_version)
+
+        if self.store is not None and any(r.cache != "shared" and r.uic_time and r.ok for r in summary.results):
+            try:
+                self.store.trim()
+            except OSError as e:
+                print(f"Could not trim the shared cache: {e}", file=sys.stderr)
+        for manifest in manifests.values():
+            try:
+                manifest.save()
+            except OSError as e:
+                print(f"Could not write {manifest.path}: {e}", file=sys.stderr)
+        summary.results.sort(key=lambda r: r.index)
+        summary.wall_time = time.perf_counter() - batch_start
+        return summary
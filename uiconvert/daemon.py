@@ -0,0 +1,561 @@
+"""Resident conversion service: `python -m uiconvert --serve`.
+
+The daemon resolves uic once, knows its version, and keeps manifests and input
+digests in memory, so a request costs little more than the conversion itself.
+Clients speak JSON lines over a local socket (a Unix domain socket, or
+127.0.0.1 where those are not available; `UI2PY_DAEMON` overrides the address).
+The default socket lives in a per-user directory only its owner can enter, and
+clients refuse a socket owned by someone else. Over TCP, any local user could
+connect, so the first line must present the token the daemon wrote to a file
+in that directory:
+
+    {"op": "auth", "token": ...}   -> {"event": "authenticated"}   TCP only
+
+    {"op": "convert", "jobs": [{"src": ..., "output": ...}], "force": false}
+    {"op": "convert", "paths": [...], "out": DIR}     files, directories or globs
+        -> {"event": "queued", "batch": N}
+        -> {"event": "started", "batch": N, "index": i} ...
+        -> {"event": "output", "batch": N, "src": ..., "line": ...} ...   uic's output as printed
+        -> {"event": "result", "batch": N, "index": i, <report row>} ...
+        -> {"event": "done", "batch": N, "run": <report totals>, ...}
+    {"op": "cancel", "batch": N, "indexes": [...]}    indexes optional
+    {"op": "status"}      -> {"event": "status", ...}
+    {"op": "subscribe"}   -> every started/result/done event from then on
+    {"op": "shutdown"}
+
+Convert requests also take "optimize" (list of passes), "bytecode", "resources",
+"targets" (list of "pyi", "pyi:DIR" or "py:DIR") and "check_xml" (default true).
+A malformed request, or a batch failing its pre-flight checks, gets an error
+event (the latter listing "problems") and nothing is converted.
+Batches run one at a time in arrival order. `DaemonClient` speaks the protocol and
+`RemoteConverter` puts it behind `Converter.convert`, so the GUI and CLI can hand
+their batches to a running daemon unchanged.
+"""
+import hmac
+import itertools
+import json
+import os
+import secrets
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Iterator
+
+from .backends import WrapperBackend, resolve_rcc
+from .cache import DigestCache
+from .core import BatchSummary, ConversionJob, Converter, FileResult, JobQueue, make_jobs
+from .optimize import PASSES
+from .preflight import preflight
+from .report import file_row, run_totals
+from .store import OutputStore
+from .targets import parse_target
+
+ENV_ADDRESS = "UI2PY_DAEMON"
+DEFAULT_PORT = 48213  # only where Unix domain sockets are unavailable
+
+# Seconds a RemoteConverter waits for an event before checking its queue for cancellations
+POLL = 0.1
+
+
+def _private_dir() -> str:
+    """Per-user directory for the socket and the TCP token."""
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return os.path.join(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(), f"ui2py-{user}")
+
+
+def _check_owner(path: str, private: bool = False):
+    """Raise PermissionError unless `path` belongs to this user (and, if `private`, is a
+    directory nobody else can use). Ownership cannot be checked where there are no uids."""
+    if not hasattr(os, "getuid"):
+        return
+    st = os.lstat(path) if private else os.stat(path)
+    if st.st_uid != os.getuid():
+        raise PermissionError(f"{path} belongs to another user")
+    if private and (not stat.S_ISDIR(st.st_mode) or st.st_mode & 0o077):
+        raise PermissionError(f"{path} is not a private directory")
+
+
+def _make_private_dir() -> str:
+    path = _private_dir()
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    _check_owner(path, private=True)
+    return path
+
+
+def _token_path(port: int) -> str:
+    return os.path.join(_private_dir(), f"daemon-{port}.token")
+
+
+def default_address() -> str:
+    env = os.environ.get(ENV_ADDRESS, "")
+    if env and env != "1":
+        return env
+    if hasattr(socket, "AF_UNIX"):
+        return os.path.join(_private_dir(), "daemon.sock")
+    return f"127.0.0.1:{DEFAULT_PORT}"
+
+
+def _tcp_address(address: str) -> tuple[str, int] | None:
+    host, _, port = address.rpartition(":")
+    if host and port.isdigit() and os.sep not in address:
+        return host, int(port)
+    return None
+
+
+def _strings(request: dict, name: str) -> list[str]:
+    value = request.get(name)
+    if value is None:
+        return []
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise ValueError(f"{name!r} must be a list of strings")
+    return value
+
+
+class _Connection:
+    """Write side of one client socket, shared by its handler and the publisher."""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+        self._lock = threading.Lock()
+
+    def send(self, message: dict) -> bool:
+        data = (json.dumps(message) + "\n").encode("utf-8")
+        with self._lock:
+            try:
+                self.wfile.write(data)
+                self.wfile.flush()
+                return True
+            except (OSError, ValueError):
+                return False
+
+
+class ConversionService:
+    """State shared by all connections: warm backends, caches, subscribers, batches."""
+
+    def __init__(self, backend: WrapperBackend, jobs: int | None = None, store: OutputStore | None = None):
+        self.backend = backend
+        self.jobs = jobs
+        self.store = store
+        self.backend.version()  # warm the version cache before the first request
+        self.manifests = {}
+        self.digests = DigestCache()
+        self._rcc = None
+        self._run_lock = threading.Lock()  # one batch at a time
+        self._lock = threading.Lock()
+        self._subscribers: list[_Connection] = []
+        self._queues: dict[int, JobQueue] = {}
+        self._batch_ids = itertools.count(1)
+        self.started_at = time.time()
+        self.batches = 0
+        self.files = 0
+        self.running: dict | None = None
+
+    def rcc(self):
+        if self._rcc is None:
+            self._rcc = resolve_rcc()
+        return self._rcc
+
+    def subscribe(self, conn: _Connection):
+        with self._lock:
+            self._subscribers.append(conn)
+
+    def unsubscribe(self, conn: _Connection):
+        with self._lock:
+            if conn in self._subscribers:
+                self._subscribers.remove(conn)
+
+    def publish(self, message: dict, requester: _Connection):
+        requester.send(message)
+        with self._lock:
+            subscribers = [c for c in self._subscribers if c is not requester]
+        for conn in subscribers:
+            if not conn.send(message):
+                self.unsubscribe(conn)
+
+    def status(self) -> dict:
+        with self._lock:
+            waiting = len(self._queues) - (1 if self.running else 0)
+            subscribers = len(self._subscribers)
+        return {"event": "status", "pid": os.getpid(), "backend": self.backend.name,
+                "uic": self.backend.version(), "uptime_s": round(time.time() - self.started_at, 3),
+                "batches": self.batches, "files": self.files, "running": self.running, "waiting": waiting,
+                "subscribers": subscribers, "manifests_cached": len(self.manifests),
+                "digests_cached": len(self.digests)}
+
+    def cancel(self, batch: int, indexes: list[int] | None) -> bool:
+        with self._lock:
+            queue = self._queues.get(batch)
+        if queue is None:
+            return False
+        queue.cancel(indexes)
+        return True
+
+    def _jobs(self, request: dict) -> list[ConversionJob]:
+        if "jobs" in request:
+            jobs = request["jobs"]
+            if not isinstance(jobs, list) or not all(
+                    isinstance(j, dict) and isinstance(j.get("src"), str) and isinstance(j.get("output"), str)
+                    for j in jobs):
+                raise ValueError('"jobs" must be a list of {"src": ..., "output": ...} objects')
+            return [ConversionJob(j["src"], j["output"]) for j in jobs]
+        out = request.get("out")
+        if out is not None and not isinstance(out, str):
+            raise ValueError('"out" must be a string')
+        from .cli import expand_inputs
+        return make_jobs(expand_inputs(_strings(request, "paths")), out)
+
+    def convert(self, request: dict, conn: _Connection):
+        """Runs on its own thread; whatever goes wrong is reported, so a client never waits forever."""
+        try:
+            self._convert(request, conn)
+        except ValueError as e:
+            conn.send({"event": "error", "message": f"bad convert request: {e}"})
+        except Exception as e:
+            conn.send({"event": "error", "message": f"{type(e).__name__}: {e}"})
+
+    def _convert(self, request: dict, conn: _Connection):
+        jobs = self._jobs(request)
+        optimize = [p for p in _strings(request, "optimize") if p in PASSES]
+        targets = tuple(parse_target(spec) for spec in _strings(request, "targets"))
+        rcc = None
+        if request.get("resources"):
+            rcc = self.rcc()
+            if rcc is None:
+                conn.send({"event": "error", "message": "pyside6-rcc not found"})
+                return
+
+        batch = None  # assigned once the batch is queued, before any output can arrive
+
+        def output(job, line):
+            self.publish({"event": "output", "batch": batch, "src": job.src, "line": line}, conn)
+
+        converter = Converter(self.backend, jobs=self.jobs, force=bool(request.get("force")),
+                              optimize=tuple(optimize), bytecode=bool(request.get("bytecode")), rcc=rcc,
+                              manifest_cache=self.manifests, digests=self.digests, on_output=output,
+                              store=self.store, targets=targets)
+        checks = preflight(jobs, check_xml=request.get("check_xml", True), targets=targets,
+                           current=converter.is_current)
+        if not checks.ok:
+            conn.send({"event": "error", "message": "pre-flight checks failed", "problems": checks.messages()})
+            return
+
+        batch = next(self._batch_ids)
+        queue = JobQueue(len(jobs))
+        with self._lock:
+            self._queues[batch] = queue
+        conn.send({"event": "queued", "batch": batch, "files": len(jobs)})
+        try:
+            with self._run_lock:
+                self.running = {"batch": batch, "files": len(jobs), "done": 0}
+
+                def started(index):
+                    self.publish({"event": "started", "batch": batch, "index": index}, conn)
+
+                def finished(result):
+                    self.running["done"] += 1
+                    self.publish({"event": "result", "batch": batch, "index": result.index, **file_row(result)}, conn)
+
+                summary = converter.convert(jobs, on_result=finished, on_start=started, queue=queue)
+                self.batches += 1
+                self.files += len(summary.results)
+                self.publish({"event": "done", "batch": batch, "run": run_totals(summary),
+                              "started_at": summary.started_at, "wall_time": summary.wall_time}, conn)
+        finally:
+            self.running = None
+            with self._lock:
+                self._queues.pop(batch, None)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        service: ConversionService = self.server.service
+        conn = _Connection(self.wfile)
+        token = getattr(self.server, "token", None)
+        if token is not None and not self._authenticate(token, conn):
+            return
+        try:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    op = request["op"]
+                except (ValueError, KeyError, TypeError):
+                    conn.send({"event": "error", "message": "expected a JSON object with an \"op\""})
+                    continue
+                if op == "convert":
+                    # Keep reading this connection while the batch runs, so its cancels get through
+                    threading.Thread(target=service.convert, args=(request, conn), daemon=True).start()
+                elif op == "cancel":
+                    batch, indexes = request.get("batch"), request.get("indexes")
+                    if not isinstance(batch, int) or not (indexes is None or isinstance(indexes, list) and all(
+                            isinstance(i, int) for i in indexes)):
+                        conn.send({"event": "error", "message": "cancel takes an integer \"batch\" and "
+                                                                "optional list of integer \"indexes\""})
+                        continue
+                    ok = service.cancel(batch, indexes)
+                    conn.send({"event": "cancelled" if ok else "error", "batch": request.get("batch"),
+                               **({} if ok else {"message": "no such batch"})})
+                elif op == "status":
+                    conn.send(service.status())
+                elif op == "subscribe":
+                    service.subscribe(conn)
+                    conn.send({"event": "subscribed"})
+                elif op == "shutdown":
+                    conn.send({"event": "bye"})
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    return
+                else:
+                    conn.send({"event": "error", "message": f"unknown op {op!r}"})
+        finally:
+            service.unsubscribe(conn)
+
+    def _authenticate(self, token: str, conn: _Connection) -> bool:
+        try:
+            request = json.loads(self.rfile.readline())
+            ok = (request.get("op") == "auth" and isinstance(request.get("token"), str)
+                  and hmac.compare_digest(request["token"], token))
+        except (ValueError, AttributeError):
+            ok = False
+        conn.send({"event": "authenticated"} if ok else {"event": "error", "message": "authentication required"})
+        return ok
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+
+class _TcpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def serve(backend: WrapperBackend, address: str | None = None, jobs: int | None = None,
+          store: OutputStore | None = None, ready: Callable[[str], None] | None = None) -> int:
+    """Run the daemon until a shutdown request or Ctrl+C."""
+    address = address or default_address()
+    tcp = _tcp_address(address)
+    token_path = None
+    try:
+        if tcp is None:
+            if address == os.path.join(_private_dir(), "daemon.sock"):
+                _make_private_dir()
+            if ping(address):
+                print(f"ui2py: a daemon is already listening on {address}", file=sys.stderr)
+                return 2
+            if os.path.lexists(address):
+                _check_owner(address)
+                os.unlink(address)  # stale socket of a daemon that did not shut down cleanly
+            umask = os.umask(0o177)  # owner-only from the moment it exists
+            try:
+                server = _UnixServer(address, _Handler)
+            finally:
+                os.umask(umask)
+        else:
+            server = _TcpServer(tcp, _Handler)
+            server.token = secrets.token_hex(32)
+            _make_private_dir()
+            token_path = _token_path(server.server_address[1])
+            try:
+                _write_token(token_path, server.token)
+            except OSError:
+                server.server_close()
+                raise
+    except OSError as e:
+        print(f"ui2py: cannot listen on {address}: {e}", file=sys.stderr)
+        return 2
+    server.service = ConversionService(backend, jobs, store)
+    if ready is not None:
+        ready(address)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.unlink(address if tcp is None else token_path)
+        except OSError:
+            pass
+    return 0
+
+
+def _write_token(path: str, token: str):
+    try:
+        os.unlink(path)  # recreate, so no earlier, looser mode survives
+    except FileNotFoundError:
+        pass
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(token)
+
+
+class DaemonClient:
+    """One connection to a running daemon. Refuses a Unix socket owned by another user,
+    and authenticates with the daemon's token over TCP."""
+
+    def __init__(self, address: str | None = None, timeout: float | None = 2.0):
+        self.address = address or default_address()
+        tcp = _tcp_address(self.address)
+        token = None
+        if tcp is None:
+            _check_owner(self.address)
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            target = self.address
+        else:
+            with open(_token_path(tcp[1])) as f:
+                token = f.read().strip()
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            target = tcp
+        self._buffer = b""
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(target)
+            if token is not None:
+                self.send({"op": "auth", "token": token})
+                if (self.receive(timeout) or {}).get("event") != "authenticated":
+                    raise PermissionError(f"daemon at {self.address} refused the token")
+        except (OSError, ValueError, ConnectionError):
+            self.sock.close()
+            raise
+
+    def close(self):
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def send(self, message: dict):
+        self.sock.settimeout(None)
+        self.sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+
+    def receive(self, timeout: float | None = None) -> dict | None:
+        """Next event, or None on timeout. Raises ConnectionError when the daemon went away."""
+        self.sock.settimeout(timeout)
+        while b"\n" not in self._buffer:
+            try:
+                chunk = self.sock.recv(65536)
+            except socket.timeout:
+                return None
+            if not chunk:
+                raise ConnectionError("daemon closed the connection")
+            self._buffer += chunk
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return json.loads(line)
+
+    def request(self, message: dict) -> dict:
+        self.send(message)
+        return self.receive()
+
+    def status(self) -> dict:
+        return self.request({"op": "status"})
+
+    def shutdown(self) -> dict:
+        return self.request({"op": "shutdown"})
+
+    def events(self) -> Iterator[dict]:
+        """Subscribe and yield every event the daemon publishes."""
+        self.request({"op": "subscribe"})
+        while True:
+            yield self.receive()
+
+
+def ping(address: str | None = None) -> bool:
+    try:
+        with DaemonClient(address, timeout=0.5) as client:
+            return client.status().get("event") == "status"
+    except (OSError, ValueError, ConnectionError):
+        return False
+
+
+def connect(address: str | None = None) -> DaemonClient | None:
+    """A client for the daemon at `address`, or None when none is running (or none that
+    this user can trust)."""
+    try:
+        return DaemonClient(address, timeout=0.5)
+    except (OSError, ValueError):
+        return None
+
+
+def _result(index: int, job: ConversionJob, row: dict) -> FileResult:
+    return FileResult(index, job, error=row.get("error") or "", up_to_date=row.get("status") == "up-to-date",
+                      queue_wait=row.get("queue_wait_ms", 0) / 1000, uic_time=row.get("uic_ms", 0) / 1000,
+                      input_size=row.get("input_bytes", 0), output_size=row.get("output_bytes", 0),
+                      cache=row.get("cache", "off"), written=bool(row.get("written")),
+                      exit_status=row.get("exit_status", 0), kind=row.get("kind", "ui"),
+                      cancelled=row.get("status") == "cancelled")
+
+
+def _absolute_target(spec: str) -> str:
+    """Target folders are relative to the client's working directory, not the daemon's."""
+    kind, _, directory = spec.partition(":")
+    return f"{kind}:{os.path.abspath(directory)}" if directory else spec
+
+
+class RemoteConverter:
+    """`Converter`-compatible front for a daemon: the batch runs in the daemon and results
+    come back as `FileResult`s. Cancellations made on the local `JobQueue` are forwarded;
+    priorities are not."""
+
+    def __init__(self, client: DaemonClient, force: bool = False, optimize: tuple[str, ...] = (),
+                 bytecode: bool = False, resources: bool = False, targets: list[str] = ()):
+        self.client = client
+        self.options = {"force": force, "optimize": list(optimize), "bytecode": bytecode, "resources": resources,
+                        "targets": [_absolute_target(spec) for spec in targets]}
+
+    def convert(self, jobs: list[ConversionJob],
+                on_result: Callable[[FileResult], None] | None = None,
+                on_start: Callable[[int], None] | None = None,
+                queue: JobQueue | None = None) -> BatchSummary:
+        jobs = [ConversionJob(os.path.abspath(j.src), os.path.abspath(j.output)) for j in jobs]
+        self.client.send({"op": "convert", "jobs": [{"src": j.src, "output": j.output} for j in jobs],
+                          **self.options})
+        summary = BatchSummary(backend="daemon", started_at=time.time())
+        batch, cancel_mark, cancelled_all = None, 0, False
+        while True:
+            event = self.client.receive(POLL if queue is not None else None)
+            if event is None or (queue is not None and batch is not None):
+                # Forward cancellations made on the local queue since the last event
+                if queue is not None and batch is not None and not cancelled_all:
+                    if queue.all_cancelled:
+                        self.client.send({"op": "cancel", "batch": batch})
+                        cancelled_all = True
+                    else:
+                        new, cancel_mark = queue.cancelled_since(cancel_mark)
+                        if new:
+                            self.client.send({"op": "cancel", "batch": batch, "indexes": new})
+                if event is None:
+                    continue
+            kind = event.get("event")
+            if kind == "error":
+                raise RuntimeError("; ".join([event.get("message", "daemon error"), *event.get("problems", ())]))
+            if event.get("batch") not in (None, batch) and batch is not None:
+                continue
+            if kind == "queued":
+                batch = event["batch"]
+            elif kind == "started" and on_start is not None:
+                on_start(event["index"])
+            elif kind == "result":
+                index = event["index"]
+                job = jobs[index] if index < len(jobs) else ConversionJob(event["src"], event["output"])
+                result = _result(index, job, event)
+                summary.results.append(result)
+                if on_result is not None:
+                    on_result(result)
+            elif kind == "done":
+                run = event["run"]
+                summary.backend, summary.jobs = f"daemon/{run['backend']}", run["jobs"]
+                summary.started_at, summary.wall_time = event["started_at"], event["wall_time"]
+                summary.results.sort(key=lambda r: r.index)
+                return summary
@@ -0,0 +1,192 @@
+"""Dependencies of .ui forms: .qrc resource files and custom widget modules.
+
+A form lists its resource collections in `<resources><include location="..."/>`
+and its promoted / custom widgets in `<customwidgets>`, whose `<header>` becomes a
+Python import in the generated code. uic turns `icons.qrc` into `import icons_rc`,
+so each referenced .qrc is compiled with rcc to `<stem>_rc.py` next to the form's
+output. A .qrc in turn depends on every file it lists.
+"""
+import hashlib
+import os
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+from .filestore import path_key
+
+RC_SUFFIX = "_rc"
+
+
+@dataclass
+class FormDeps:
+    resources: list[str] = field(default_factory=list)          # .qrc paths
+    custom_widgets: dict[str, str] = field(default_factory=dict)  # class -> header
+    modules: list[str] = field(default_factory=list)            # local files providing custom widgets
+
+
+def rc_output_name(qrc: str) -> str:
+    """The module uic imports for `qrc`: icons.qrc -> icons_rc.py"""
+    return os.path.splitext(os.path.basename(qrc))[0] + RC_SUFFIX + ".py"
+
+
+def header_module(header: str) -> str:
+    """Module path uic generates an import for: "widgets/chart.h" -> "widgets.chart"."""
+    stem = header.strip()
+    for suffix in (".h", ".hpp", ".hxx", ".py"):
+        if stem.endswith(suffix):
+            stem = stem[:-len(suffix)]
+            break
+    return stem.replace("/", ".").replace("\\", ".").strip(".")
+
+
+def _module_file(module: str, search_dirs: Iterable[str]) -> str | None:
+    rel = module.replace(".", os.sep)
+    for directory in search_dirs:
+        for candidate in (rel + ".py", os.path.join(rel, "__init__.py")):
+            path = os.path.join(directory, candidate)
+            if os.path.isfile(path):
+                return os.path.normpath(path)
+    return None
+
+
+def iter_elements(path: str, keep: Iterable[str] = ()) -> Iterator[ET.Element]:
+    """Elements of an XML file in document order of their closing tags, parsed incrementally.
+
+    Each element is detached from its parent once the caller has seen it, so memory
+    stays flat however large the document is; elements inside a `keep` tag stay
+    attached until that tag closes, so the caller can still read their children.
+    """
+    keep = set(keep)
+    stack: list[ET.Element] = []
+    kept = 0  # open `keep` elements
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            kept += elem.tag in keep
+            continue
+        stack.pop()
+        yield elem
+        kept -= elem.tag in keep
+        if stack and not kept:
+            stack[-1].remove(elem)
+
+
+def parse_ui(path: str, search_dirs: Iterable[str] = ()) -> FormDeps:
+    """Resources and custom widgets referenced by a .ui file.
+
+    Custom widget headers are resolved to local modules in the form's directory or
+    `search_dirs`; headers that do not resolve (library widgets) are not tracked.
+    """
+    base = os.path.dirname(path)
+    deps = FormDeps()
+    for elem in iter_elements(path, keep=("customwidget",)):
+        if elem.tag == "include" and elem.get("location", "").endswith(".qrc"):
+            qrc = os.path.normpath(os.path.join(base, elem.get("location")))
+            if qrc not in deps.resources:
+                deps.resources.append(qrc)
+        elif elem.tag == "customwidget":
+            cls, header = elem.findtext("class"), elem.findtext("header")
+            if cls and header:
+                deps.custom_widgets[cls] = header
+    for header in deps.custom_widgets.values():
+        module = _module_file(header_module(header), [base or os.curdir, *search_dirs])
+        if module and module not in deps.modules:
+            deps.modules.append(module)
+    return deps
+
+
+def parse_qrc(path: str) -> list[str]:
+    """Files listed by a .qrc, relative paths resolved against its directory."""
+    base = os.path.dirname(path)
+    return [os.path.normpath(os.path.join(base, elem.text.strip()))
+            for elem in iter_elements(path) if elem.tag == "file" and elem.text and elem.text.strip()]
+
+
+def resource_digest(qrc: str) -> str:
+    """SHA-256 over the .qrc and every file it lists; rcc output changes with any of them."""
+    h = hashlib.sha256()
+    with open(qrc, "rb") as f:
+        h.update(hashlib.file_digest(f, "sha256").digest())
+    for path in parse_qrc(qrc):
+        h.update(path_key(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            h.update(hashlib.file_digest(f, "sha256").digest())
+    return h.hexdigest()
+
+
+class DependencyGraph:
+    """Forms and what they depend on, with the reverse edges to answer "what does a
+    change to this file affect?"."""
+
+    def __init__(self):
+        self.forms: dict[str, FormDeps] = {}          # form key -> deps
+        self.resources: dict[str, list[str]] = {}     # qrc key -> listed files
+        self._paths: dict[str, str] = {}              # key -> path as given
+        self._dependents: dict[str, set[str]] = {}    # dependency key -> dependent keys
+
+    def _link(self, dependency: str, dependent_key: str):
+        key = path_key(dependency)
+        self._paths.setdefault(key, dependency)
+        self._dependents.setdefault(key, set()).add(dependent_key)
+
+    def _unlink(self, dependent_key: str):
+        for dependents in self._dependents.values():
+            dependents.discard(dependent_key)
+
+    def add_form(self, path: str, search_dirs: Iterable[str] = ()) -> FormDeps:
+        """(Re)read a form's dependencies; unreadable forms are recorded without any."""
+        key = path_key(path)
+        self._paths[key] = path
+        self._unlink(key)
+        try:
+            deps = parse_ui(path, search_dirs)
+        except (OSError, ET.ParseError):
+            deps = FormDeps()
+        self.forms[key] = deps
+        for qrc in deps.resources:
+            self._link(qrc, key)
+            self.add_resource(qrc)
+        for module in deps.modules:
+            self._link(module, key)
+        return deps
+
+    def add_resource(self, qrc: str):
+        key = path_key(qrc)
+        self._unlink(key)
+        try:
+            files = parse_qrc(qrc)
+        except (OSError, ET.ParseError):
+            files = []
+        self.resources[key] = files
+        for path in files:
+            self._link(path, key)
+
+    def remove(self, path: str):
+        """Forget a deleted form or .qrc, and any .qrc that no remaining form includes."""
+        key = path_key(path)
+        deps = self.forms.pop(key, None)
+        self.resources.pop(key, None)
+        self._unlink(key)
+        for qrc in deps.resources if deps is not None else ():
+            qrc_key = path_key(qrc)
+            if not self._dependents.get(qrc_key):
+                self.resources.pop(qrc_key, None)
+                self._unlink(qrc_key)
+
+    def dependencies(self) -> list[str]:
+        """Every file some form depends on, directly or through a .qrc."""
+        return [self._paths[key] for key, dependents in self._dependents.items() if dependents]
+
+    def affected(self, changed: Iterable[str]) -> tuple[list[str], list[str]]:
+        """Forms and .qrc files to rebuild after `changed` files were modified."""
+        seen: set[str] = set()
+        stack = [path_key(p) for p in changed]
+        while stack:
+            key = stack.pop()
+            if key in seen:
+                continue
+            seen.add(key)
+            stack.extend(self._dependents.get(key, ()))
+        forms = [self._paths[k] for k in seen if k in self.forms]
+        resources = [self._paths[k] for k in seen if k in self.resources]
+        return sorted(forms), sorted(resources)
@@ -0,0 +1,48 @@
+import os
+from typing import Iterable, Iterator
+
+
+def path_key(path: str) -> str:
+    """Identity of an input file: absolute, normalised and case-folded where the OS is."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+class FileStore:
+    """Ordered set of input files keyed on their full path.
+
+    Backed by an insertion-ordered dict, so membership, add and remove are O(1)
+    per path and two inputs that share a basename stay distinct.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()):
+        self._paths: dict[str, str] = {}  # key -> path as given
+        self.add(paths)
+
+    def add(self, paths: Iterable[str]) -> list[str]:
+        """Add `paths` in order, skipping ones already present; returns the keys that were new."""
+        added = []
+        for path in paths:
+            key = path_key(path)
+            if key not in self._paths:
+                self._paths[key] = os.path.normpath(path)
+                added.append(key)
+        return added
+
+    def discard(self, keys: Iterable[str]):
+        for key in keys:
+            self._paths.pop(key, None)
+
+    def clear(self):
+        self._paths.clear()
+
+    def path(self, key: str) -> str:
+        return self._paths[key]
+
+    def __contains__(self, path: str) -> bool:
+        return path_key(path) in self._paths
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths.values())
@@ -0,0 +1,289 @@
+"""Optional post-processing of uic's Python output.
+
+Passes (all line-based edits guided by `ast`, so uic's layout and comments survive):
+
+- `imports`: drop names from the `from PySide6.* import (...)` blocks that the form
+  never uses. PySide6 initialises every class it hands out, so unused imports are
+  paid for each time the form is imported.
+- `translations`: bind `QCoreApplication.translate` to a local once per
+  retranslate method instead of resolving the attribute for every string.
+- `lazy-pages`: widgets on QTabWidget / QStackedWidget / QToolBox pages that are
+  not current at start-up are created the first time their page is shown.
+  Children of such pages do not exist until then (call `build_all_pages()` to force
+  them) and are not auto-connected by `connectSlotsByName`. Pages whose widgets are
+  referenced outside their own block are left alone.
+"""
+import ast
+import builtins
+
+PASSES = ("imports", "translations", "lazy-pages")
+DEFAULT_PASSES = ("imports", "translations")
+
+_TRANSLATE = "QCoreApplication.translate("
+_PAGE_ADDERS = {"addTab", "addWidget", "addItem"}
+
+
+def _self_attr(node) -> str | None:
+    """`self.name` -> "name"."""
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "self":
+        return node.attr
+    return None
+
+
+def _ui_class(tree: ast.Module):
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            methods = {f.name: f for f in node.body if isinstance(f, ast.FunctionDef)}
+            if "setupUi" in methods and "retranslateUi" in methods:
+                return node, methods
+    return None, {}
+
+
+def _self_attrs_used(nodes) -> set[str]:
+    return {name for n in nodes for sub in ast.walk(n) if (name := _self_attr(sub))}
+
+
+def _names(nodes, ctx) -> set[str]:
+    return {sub.id for n in nodes for sub in ast.walk(n) if isinstance(sub, ast.Name) and isinstance(sub.ctx, ctx)}
+
+
+def _with_config_guard(lines: list[str], first: int, last: int) -> tuple[int, int]:
+    """Extend a 0-based line span over a surrounding `#if QT_CONFIG(...)` / `#endif` pair."""
+    if first > 0 and last + 1 < len(lines) and lines[first - 1].startswith("#if ") \
+            and lines[last + 1].startswith("#endif"):
+        return first - 1, last + 1
+    return first, last
+
+
+def lazy_pages(source: str) -> str:
+    tree = ast.parse(source)
+    cls, methods = _ui_class(tree)
+    if cls is None:
+        return source
+    setup, retranslate = methods["setupUi"], methods["retranslateUi"]
+    form = setup.args.args[1].arg if len(setup.args.args) > 1 else None
+    stmts = setup.body
+    module_names = {n for node in tree.body if isinstance(node, ast.ImportFrom) for n in (a.asname or a.name for a in node.names)}
+    known_globals = module_names | set(dir(builtins)) | {"self"}
+
+    # Pages created as `self.page = QWidget()` and later `self.container.addTab(self.page, ...)`
+    created = {}
+    for i, st in enumerate(stmts):
+        if isinstance(st, ast.Assign) and len(st.targets) == 1 and (name := _self_attr(st.targets[0])) \
+                and isinstance(st.value, ast.Call) and isinstance(st.value.func, ast.Name) \
+                and st.value.func.id == "QWidget" and not st.value.args:
+            created[name] = i
+    containers: dict[str, list[tuple[str, int]]] = {}
+    current: dict[str, int] = {}
+    for j, st in enumerate(stmts):
+        if not (isinstance(st, ast.Expr) and isinstance(st.value, ast.Call) and isinstance(st.value.func, ast.Attribute)):
+            continue
+        call = st.value
+        container = _self_attr(call.func.value)
+        if container is None:
+            continue
+        if call.func.attr in _PAGE_ADDERS and call.args and (page := _self_attr(call.args[0])) in created:
+            containers.setdefault(container, []).append((page, j))
+        elif call.func.attr == "setCurrentIndex" and call.args:
+            arg = call.args[0]
+            current[container] = arg.value if isinstance(arg, ast.Constant) and isinstance(arg.value, int) else -1
+
+    retranslate_stmts = retranslate.body
+    candidates = []  # (page, container, body span in stmts, retranslate statement indexes)
+    for container, pages in containers.items():
+        active = current.get(container, 0)
+        if active < 0:
+            continue
+        for ordinal, (page, add_at) in enumerate(pages):
+            start = created[page]
+            if ordinal == active or add_at <= start + 2:
+                continue
+            name_stmt = stmts[start + 1]
+            if not (isinstance(name_stmt, ast.Expr) and isinstance(name_stmt.value, ast.Call)
+                    and isinstance(name_stmt.value.func, ast.Attribute)
+                    and name_stmt.value.func.attr == "setObjectName" and _self_attr(name_stmt.value.func.value) == page):
+                continue
+            body = stmts[start + 2:add_at]
+            rest = stmts[:start] + stmts[add_at:]
+            attrs = {_self_attr(t) for st in body if isinstance(st, ast.Assign) for t in st.targets} - {None}
+            if not attrs:
+                continue
+            loaded, stored = _names(body, ast.Load), _names(body, ast.Store)
+            if (loaded - stored - known_globals) or (stored & _names(rest, ast.Load)) or (attrs & _self_attrs_used(rest)):
+                continue  # shares locals or widgets with the rest of setupUi
+            moved = [k for k, st in enumerate(retranslate_stmts) if _self_attrs_used([st]) & attrs]
+            if any(not isinstance(retranslate_stmts[k], ast.Expr) or (form and form in _names([retranslate_stmts[k]], ast.Load))
+                   for k in moved):
+                continue
+            candidates.append((page, container, (start + 2, add_at), moved))
+
+    # Nested pages travel with their outer page
+    candidates.sort(key=lambda c: c[2][0])
+    chosen, reach = [], -1
+    for cand in candidates:
+        if cand[2][0] >= reach:
+            chosen.append(cand)
+            reach = cand[2][1]
+    if not chosen:
+        return source
+
+    lines = source.splitlines(keepends=True)
+    indent = " " * setup.body[0].col_offset
+    removed: set[int] = set()
+    extra_methods = []
+    for page, container, (first, end), moved in chosen:
+        span_first = stmts[first - 1].end_lineno  # 0-based index of the line after setObjectName
+        span_last = stmts[end].lineno - 2          # 0-based index of the line before addTab
+        body_lines = lines[span_first:span_last + 1]
+        removed.update(range(span_first, span_last + 1))
+
+        retr_lines = []
+        for k in moved:
+            st = retranslate_stmts[k]
+            a, b = _with_config_guard(lines, st.lineno - 1, st.end_lineno - 1)
+            retr_lines += lines[a:b + 1]
+            removed.update(range(a, b + 1))
+
+        while body_lines and not body_lines[-1].strip():
+            body_lines.pop()
+        method = [f"\n{indent[:-4]}def _build_{page}(self):\n",
+                  f"{indent}visible = self.{page}.isVisible()\n",
+                  f"{indent}if visible:\n", f"{indent}    self.{page}.hide()\n",
+                  *body_lines,
+                  f"{indent}self._retranslate_{page}()\n",
+                  f"{indent}if visible:\n", f"{indent}    self.{page}.show()\n",
+                  f"\n{indent[:-4]}def _retranslate_{page}(self):\n",
+                  *(retr_lines or [f"{indent}pass\n"])]
+        extra_methods.append("".join(method))
+
+    # setupUi: register the deferred pages right before retranslateUi is first called
+    retr_call = next(i for i, st in enumerate(stmts)
+                     if isinstance(st, ast.Expr) and isinstance(st.value, ast.Call)
+                     and isinstance(st.value.func, ast.Attribute) and st.value.func.attr == "retranslateUi")
+    register = [f"{indent}self._lazy_pages = {{{', '.join(f'self.{p}: self._build_{p}' for p, *_ in chosen)}}}\n"]
+    for container in dict.fromkeys(c for _, c, _, _ in chosen):
+        register.append(f"{indent}self.{container}.currentChanged.connect("
+                        f"lambda index: self._build_page(self.{container}.widget(index)))\n")
+    register.append("\n")
+
+    # retranslateUi: translate deferred pages that already exist
+    retr_tail = []
+    for page, *_ in chosen:
+        retr_tail += [f"{indent}if self.{page} not in self._lazy_pages:\n", f"{indent}    self._retranslate_{page}()\n"]
+
+    helpers = (f"\n{indent[:-4]}def _build_page(self, page):\n"
+               f"{indent}build = self._lazy_pages.pop(page, None)\n"
+               f"{indent}if build is not None:\n"
+               f"{indent}    build()\n"
+               f"\n{indent[:-4]}def build_all_pages(self):\n"
+               f"{indent}for page in list(self._lazy_pages):\n"
+               f"{indent}    self._build_page(page)\n")
+
+    # uic closes retranslateUi with `pass` and a `# retranslateUi` marker; keep both last
+    last = retranslate_stmts[-1]
+    tail_at = last.lineno - 1 if isinstance(last, ast.Pass) else last.end_lineno
+    methods_at = retranslate.end_lineno
+    if methods_at < len(lines) and lines[methods_at].strip() == "# retranslateUi":
+        methods_at += 1
+    retr_call_line = stmts[retr_call].lineno - 1
+    out = []
+    for i, line in enumerate(lines):
+        if i == retr_call_line:
+            out += register
+        if i == tail_at:
+            out += retr_tail
+        if i == methods_at:
+            out += extra_methods
+            out.append(helpers)
+        if i not in removed:
+            out.append(line)
+    if methods_at >= len(lines):
+        out += extra_methods
+        out.append(helpers)
+    return "".join(out)
+
+
+def batch_translations(source: str) -> str:
+    tree = ast.parse(source)
+    cls, _ = _ui_class(tree)
+    if cls is None:
+        return source
+    lines = source.splitlines(keepends=True)
+    inserts = {}
+    for func in cls.body:
+        if not (isinstance(func, ast.FunctionDef) and (func.name == "retranslateUi" or func.name.startswith("_retranslate_"))):
+            continue
+        first, last = func.body[0].lineno - 1, func.end_lineno - 1
+        if sum(line.count(_TRANSLATE) for line in lines[first:last + 1]) < 2:
+            continue
+        for i in range(first, last + 1):
+            lines[i] = lines[i].replace(_TRANSLATE, "_translate(")
+        inserts[first] = " " * func.body[0].col_offset + "_translate = QCoreApplication.translate\n"
+    if not inserts:
+        return source
+    out = []
+    for i, line in enumerate(lines):
+        if i in inserts:
+            out.append(inserts[i])
+        out.append(line)
+    return "".join(out)
+
+
+def format_import(module: str, names: list[str]) -> str:
+    """uic's layout: a parenthesised list, four names per line."""
+    rows = [", ".join(names[i:i + 4]) for i in range(0, len(names), 4)]
+    return f"from {module} import (" + ",\n    ".join(rows) + ")\n"
+
+
+def prune_imports(source: str) -> str:
+    tree = ast.parse(source)
+    used = {n.id for n in ast.walk(tree) if isinstance(n, ast.Name)}
+    lines = source.splitlines(keepends=True)
+    replacements = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and (node.module or "").startswith("PySide6") \
+                and all(a.asname is None for a in node.names) and node.names[0].name != "*":
+            keep = [a.name for a in node.names if a.name in used]
+            if len(keep) != len(node.names):
+                replacements[node.lineno - 1] = (node.end_lineno - 1, format_import(node.module, keep) if keep else "")
+    if not replacements:
+        return source
+    out, i = [], 0
+    while i < len(lines):
+        if i in replacements:
+            end, text = replacements[i]
+            out.append(text)
+            i = end + 1
+        else:
+            out.append(lines[i])
+            i += 1
+    return "".join(out)
+
+
+def optimize_source(source: str, passes=DEFAULT_PASSES) -> str:
+    if "lazy-pages" in passes:
+        source = lazy_pages(source)
+    if "translations" in passes:
+        source = batch_translations(source)
+    if "imports" in passes:
+        source = prune_imports(source)
+    return source
+
+
+def optimize_file(path: str, passes=DEFAULT_PASSES):
+    """Rewrite a generated module in place."""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    optimized = optimize_source(source, passes)
+    if optimized != source:
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(optimized)
+
+
+def parse_passes(spec: str) -> tuple[str, ...]:
+    """"imports,lazy-pages" -> validated tuple in canonical order."""
+    wanted = {p.strip() for p in spec.split(",") if p.strip()}
+    unknown = wanted - set(PASSES)
+    if unknown:
+        raise ValueError(f"unknown optimizer pass(es): {', '.join(sorted(unknown))}")
+    return tuple(p for p in PASSES if p in wanted)
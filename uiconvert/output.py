@@ -0,0 +1,61 @@
+"""Atomic, write-if-changed output files.
+
+uic writes into a hidden temporary file next to the target; the result only
+replaces the target (with `os.replace`, atomic on the same filesystem) when its
+bytes differ. Unchanged outputs keep their mtime, so importers, bytecode caches
+and bundlers downstream see nothing to rebuild, and no reader ever observes a
+half-written file.
+"""
+import filecmp
+import os
+import shutil
+import threading
+
+
+def temp_output_path(output: str) -> str:
+    """A sibling path unique to this process and thread."""
+    directory, name = os.path.split(output)
+    return os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def discard(tmp: str):
+    try:
+        os.remove(tmp)
+    except OSError:
+        pass
+
+
+def commit_output(tmp: str, output: str) -> bool:
+    """Move `tmp` over `output` unless both hold the same bytes. Returns True if `output` changed."""
+    try:
+        same = filecmp.cmp(tmp, output, shallow=False)
+    except OSError:
+        same = False  # no previous output
+    if same:
+        discard(tmp)
+        return False
+    if os.path.exists(output):
+        try:
+            shutil.copymode(output, tmp)
+        except OSError:
+            pass
+    os.replace(tmp, output)
+    return True
+
+
+def write_if_changed(output: str, data: bytes) -> bool:
+    """Atomically write `data` to `output` if it differs. Returns True if `output` changed."""
+    try:
+        with open(output, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    tmp = temp_output_path(output)
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        return commit_output(tmp, output)
+    except BaseException:
+        discard(tmp)
+        raise
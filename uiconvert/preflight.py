@@ -0,0 +1,104 @@
+"""Whole-batch checks run before any uic process starts.
+
+Inputs are looked up with one `os.scandir` per directory rather than a stat per
+file, output folders are checked once each, clashing output names are found for
+the whole set, and every form the manifest does not already vouch for is scanned
+for well-formed XML with expat (no tree is built, and no Python code runs past
+the root element). A batch that cannot succeed is refused up front with every
+problem listed, instead of failing file by file inside uic.
+"""
+import os
+import xml.parsers.expat
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from .core import ConversionJob, output_collisions
+from .targets import Target
+
+CHUNK = 1 << 16
+
+
+@dataclass
+class PreflightReport:
+    missing: list[str] = field(default_factory=list)               # inputs that are not files
+    unwritable: dict[str, str] = field(default_factory=dict)      # output folder -> reason
+    collisions: dict[str, list[str]] = field(default_factory=dict)  # output key -> inputs
+    malformed: dict[str, str] = field(default_factory=dict)       # input -> XML error
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.unwritable or self.collisions or self.malformed)
+
+    def messages(self) -> list[str]:
+        return ([f"no such file: {p}" for p in self.missing]
+                + [f"cannot write to {d}: {reason}" for d, reason in self.unwritable.items()]
+                + [f"{out} would be written by {', '.join(srcs)}" for out, srcs in self.collisions.items()]
+                + [f"{src}: {error}" for src, error in self.malformed.items()])
+
+
+def missing_files(paths: list[str]) -> list[str]:
+    """Paths that are not regular files, listing each directory once."""
+    by_dir: dict[str, list[str]] = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path) or os.curdir, []).append(path)
+    missing = []
+    for directory, group in by_dir.items():
+        try:
+            with os.scandir(directory) as it:
+                files = {os.path.normcase(e.name) for e in it if e.is_file()}
+        except OSError:
+            files = set()
+        missing.extend(p for p in group if os.path.normcase(os.path.basename(p)) not in files)
+    return missing
+
+
+def unwritable_dirs(jobs: list[ConversionJob]) -> dict[str, str]:
+    """Output folders that do not exist or cannot be written, checked once each."""
+    problems = {}
+    for directory in {os.path.dirname(os.path.abspath(job.output)) for job in jobs}:
+        if not os.path.isdir(directory):
+            problems[directory] = "no such folder"
+        elif not os.access(directory, os.W_OK):
+            problems[directory] = "permission denied"
+    return problems
+
+
+def xml_error(path: str) -> str:
+    """Why `path` is not a well-formed .ui document, or "" when it is."""
+    parser = xml.parsers.expat.ParserCreate()
+    root = []
+
+    def start(name, attrs):
+        root.append(name)
+        parser.StartElementHandler = None  # the rest is checked by expat alone
+
+    parser.StartElementHandler = start
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(CHUNK):
+                parser.Parse(chunk, False)
+            parser.Parse(b"", True)
+    except xml.parsers.expat.ExpatError as e:
+        return f"not well-formed XML: {e}"
+    except OSError as e:
+        return str(e)
+    if root != ["ui"]:
+        return f"not a Designer form (root element <{root[0] if root else ''}>)"
+    return ""
+
+
+def preflight(jobs: list[ConversionJob], check_xml: bool = True, targets: Iterable[Target] = (),
+              current: Callable[[ConversionJob], bool] | None = None) -> PreflightReport:
+    """Check `jobs`; the paths of extra `targets` are checked for writability and clashes too.
+    Jobs for which `current` (e.g. `Converter.is_current`) returns true skip the XML scan."""
+    outputs = jobs + [ConversionJob(job.src, target.path(job.output)) for target in targets for job in jobs]
+    report = PreflightReport(missing=missing_files([job.src for job in jobs]),
+                             unwritable=unwritable_dirs(outputs), collisions=output_collisions(outputs))
+    if check_xml and report.ok:  # already doomed otherwise
+        for job in jobs:
+            if current is not None and current(job):
+                continue
+            error = xml_error(job.src)
+            if error:
+                report.malformed[job.src] = error
+    return report
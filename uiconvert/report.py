@@ -0,0 +1,71 @@
+"""Machine-readable run reports: one row per file plus batch totals, as JSON or CSV."""
+import csv
+import json
+import os
+import time
+
+from .core import BatchSummary, FileResult
+
+
+FILE_FIELDS = ("kind", "src", "output", "status", "exit_status", "cache", "written", "queue_wait_ms", "uic_ms",
+               "input_bytes", "output_bytes", "error")
+
+
+def file_row(result: FileResult) -> dict:
+    if result.cancelled:
+        status = "cancelled"
+    elif result.error:
+        status = "failed"
+    elif result.up_to_date:
+        status = "up-to-date"
+    else:
+        status = "converted"
+    return {
+        "kind": result.kind,
+        "src": result.job.src,
+        "output": result.job.output,
+        "status": status,
+        "exit_status": result.exit_status,
+        "cache": result.cache,
+        "written": result.written,
+        "queue_wait_ms": round(result.queue_wait * 1000, 3),
+        "uic_ms": round(result.uic_time * 1000, 3),
+        "input_bytes": result.input_size,
+        "output_bytes": result.output_size,
+        "error": result.error,
+    }
+
+
+def run_totals(summary: BatchSummary) -> dict:
+    results = summary.results
+    uic_times = [r.uic_time for r in results if r.uic_time]
+    return {
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(summary.started_at)),
+        "backend": summary.backend,
+        "jobs": summary.jobs,
+        "files": len(results),
+        "converted": summary.rebuilt,
+        "up_to_date": summary.up_to_date,
+        "written": summary.written,
+        "failed": len(summary.errors),
+        "cancelled": summary.cancelled,
+        "wall_ms": round(summary.wall_time * 1000, 3),
+        "files_per_second": round(summary.throughput, 3),
+        "uic_ms_total": round(sum(uic_times) * 1000, 3),
+        "uic_ms_max": round(max(uic_times, default=0.0) * 1000, 3),
+        "queue_wait_ms_max": round(max((r.queue_wait for r in results), default=0.0) * 1000, 3),
+        "input_bytes": sum(r.input_size for r in results),
+        "output_bytes": sum(r.output_size for r in results),
+    }
+
+
+def write_report(summary: BatchSummary, path: str):
+    """Write the report; `.csv` gives per-file rows, anything else JSON with totals and files."""
+    if os.path.splitext(path)[1].lower() == ".csv":
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=FILE_FIELDS)
+            writer.writeheader()
+            writer.writerows(file_row(r) for r in summary.results)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"run": run_totals(summary), "files": [file_row(r) for r in summary.results]}, f, indent=1)
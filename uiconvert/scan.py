@@ -0,0 +1,220 @@
+"""Streaming .ui discovery for large project trees.
+
+`iter_ui_files` walks with `os.scandir` and yields paths as it finds them, pruning
+ignored directories before descending, so memory use does not grow with the size
+of the tree. Symlinked directories are not followed, so link cycles cannot make
+it loop. `.gitignore` files are honoured with the usual git semantics (last
+matching pattern wins, `!` re-includes, trailing `/` matches directories only,
+a pattern containing `/` is anchored to the file's directory). `glob_ui_files`
+expands `**` patterns with the same walk; `walk_ui_tree` and `list_ui_dir` also
+report the directories, for watching them.
+"""
+import glob
+import os
+import re
+from itertools import islice
+from typing import Iterable, Iterator
+
+
+IGNORE_FILE = ".gitignore"
+
+# Never worth descending into, with or without a .gitignore
+DEFAULT_IGNORES = (".git/", ".hg/", ".svn/", "__pycache__/", "node_modules/", ".venv/", "venv/", ".tox/")
+
+
+def _translate(pattern: str) -> str:
+    """gitignore glob -> regex body (without anchors)."""
+    out, i, n = [], 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            j = pattern.find("]", i + 2)
+            if j == -1:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1:j]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = j + 1
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+class IgnoreRule:
+    __slots__ = ("regex", "negate", "dir_only")
+
+    def __init__(self, pattern: str):
+        self.negate = pattern.startswith("!")
+        if self.negate:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        body = _translate(pattern.lstrip("/"))
+        self.regex = re.compile(("" if anchored else "(?:.*/)?") + body + r"\Z")
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        return (is_dir or not self.dir_only) and self.regex.match(rel_path) is not None
+
+
+def parse_ignore(lines: Iterable[str]) -> list[IgnoreRule]:
+    rules = []
+    for line in lines:
+        line = line.rstrip("\n\r")
+        if line.endswith("\\ "):
+            line = line[:-2] + " "
+        else:
+            line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("\\#") or line.startswith("\\!"):
+            line = line[1:]
+        rules.append(IgnoreRule(line))
+    return rules
+
+
+def _load_ignore_file(directory: str) -> list[IgnoreRule]:
+    try:
+        with open(os.path.join(directory, IGNORE_FILE), encoding="utf-8", errors="replace") as f:
+            return parse_ignore(f)
+    except OSError:
+        return []
+
+
+def _ignored(scopes: list[tuple[str, list[IgnoreRule]]], path: str, is_dir: bool) -> bool:
+    """Evaluate every .gitignore from the root down; the last matching rule decides."""
+    ignored = False
+    for base, rules in scopes:
+        rel = os.path.relpath(path, base).replace(os.sep, "/") if base else os.path.basename(path)
+        for rule in rules:
+            if rule.matches(rel, is_dir):
+                ignored = not rule.negate
+    return ignored
+
+
+def _parent_scopes(base: str, directory: str, use_ignore_files: bool, defaults) -> list | None:
+    """The ignore scopes a walk from `base` applies inside `directory`, apart from
+    `directory`'s own ignore file; None when `directory` or a folder above it is ignored."""
+    scopes = [defaults]
+    rel = os.path.relpath(directory, base)
+    current = base
+    for part in [] if rel == os.curdir else rel.split(os.sep):
+        if use_ignore_files:
+            rules = _load_ignore_file(current)
+            if rules:
+                scopes = scopes + [(current, rules)]
+        current = os.path.join(current, part)
+        if _ignored(scopes, current, True):
+            return None
+    return scopes
+
+
+def _children(directory: str, scopes: list) -> tuple[list[str], list[str]]:
+    """Subdirectories and .ui files of `directory` that `scopes` do not ignore, by name."""
+    try:
+        entries = sorted(os.scandir(directory), key=lambda e: e.name)
+    except OSError:
+        return [], []
+    subdirs, files = [], []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)  # a linked directory may loop back up
+        except OSError:
+            continue
+        if is_dir:
+            if not _ignored(scopes, entry.path, True):
+                subdirs.append(entry.path)
+        elif entry.name.endswith(".ui") and not _ignored(scopes, entry.path, False):
+            files.append(entry.path)
+    return subdirs, files
+
+
+def walk_ui_tree(root: str, use_ignore_files: bool = True, extra_ignores: Iterable[str] = (),
+                 base: str | None = None) -> Iterator[tuple[str, bool]]:
+    """Yield `(path, is_dir)` for `root`, every directory below it that is not ignored and
+    every .ui file, lazily and depth-first. With `base`, `root` lies somewhere below it and
+    is walked with the ignore rules a walk from `base` would apply there."""
+    defaults = ("", parse_ignore([*DEFAULT_IGNORES, *extra_ignores]))
+    root = os.path.normpath(root)
+    scopes = [defaults] if base is None else _parent_scopes(os.path.normpath(base), root, use_ignore_files, defaults)
+    if scopes is None:
+        return
+    # Each stack entry carries the .gitignore scopes that apply to that directory
+    stack: list[tuple[str, list]] = [(root, scopes)]
+    while stack:
+        directory, scopes = stack.pop()
+        yield directory, True
+        if use_ignore_files:
+            rules = _load_ignore_file(directory)
+            if rules:
+                scopes = scopes + [(directory, rules)]
+        subdirs, files = _children(directory, scopes)
+        for path in files:
+            yield path, False
+        stack.extend((path, scopes) for path in reversed(subdirs))
+
+
+def iter_ui_files(root: str, use_ignore_files: bool = True, extra_ignores: Iterable[str] = ()) -> Iterator[str]:
+    """Yield every .ui file below `root`, lazily and depth-first."""
+    return (path for path, is_dir in walk_ui_tree(root, use_ignore_files, extra_ignores) if not is_dir)
+
+
+def list_ui_dir(directory: str, base: str, use_ignore_files: bool = True) -> tuple[list[str], list[str]]:
+    """The subdirectories and .ui files directly in `directory` that a walk from `base` visits."""
+    defaults = ("", parse_ignore(DEFAULT_IGNORES))
+    directory = os.path.normpath(directory)
+    scopes = _parent_scopes(os.path.normpath(base), directory, use_ignore_files, defaults)
+    if scopes is None:
+        return [], []
+    if use_ignore_files:
+        rules = _load_ignore_file(directory)
+        if rules:
+            scopes = scopes + [(directory, rules)]
+    return _children(directory, scopes)
+
+
+def glob_ui_files(pattern: str) -> Iterator[str]:
+    """Like `glob.iglob(pattern, recursive=True)`, but `**` does not follow symlinked
+    directories: the part after the first `**` is matched against the .ui files the
+    walk below each base directory finds. Ignore files are not consulted."""
+    parts = pattern.replace(os.sep, "/").split("/")
+    first = next((i for i, part in enumerate(parts) if "**" in part), None)
+    if first is None:
+        yield from glob.iglob(pattern)
+        return
+    base = "/".join(parts[:first])
+    regex = re.compile(_translate("/".join(parts[first:])) + r"\Z")
+    for root in glob.iglob(base) if glob.has_magic(base) else [base]:
+        if os.path.isdir(root or os.curdir):
+            for path in iter_ui_files(root or os.curdir, use_ignore_files=False):
+                rel = os.path.relpath(path, root or os.curdir).replace(os.sep, "/")
+                if regex.match(rel):
+                    yield path if root else rel
+
+
+def iter_chunks(iterable: Iterable[str], size: int) -> Iterator[list[str]]:
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
@@ -0,0 +1,121 @@
+"""Content-addressed store of generated forms, shared between checkouts, users and CI.
+
+uic's output depends only on the form's bytes, its file name (quoted in the
+generated header), the uic version and the optimizer passes, so `output_key`
+hashes exactly those. A `Converter` with a store looks the key up before running
+uic and puts what it generated afterwards. `DirectoryStore` keeps objects in a
+local or network folder; any other `OutputStore` subclass (an HTTP or
+object-storage client, say) can take its place.
+"""
+import hashlib
+import os
+import time
+from abc import ABC, abstractmethod
+
+from .output import discard, temp_output_path
+
+STORE_ENV = "UI2PY_CACHE"
+DEFAULT_MAX_BYTES = 512 << 20
+DEFAULT_MAX_AGE = 30 * 24 * 3600  # seconds since an object was last used
+
+
+def output_key(digest: str, build_key: str, src: str) -> str:
+    h = hashlib.sha256()
+    for part in (digest, build_key, os.path.basename(src)):
+        h.update(part.encode("utf-8") + b"\0")
+    return h.hexdigest()
+
+
+class OutputStore(ABC):
+    """Interface of a shared output cache; `get` and `put` must be safe to call from
+    several threads and processes at once. A subclass missing either cannot be created."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """The object stored under `key`, or None."""
+
+    @abstractmethod
+    def put(self, key: str, data: bytes):
+        """Store `data` under `key`."""
+
+    def trim(self):
+        """Evict entries beyond the store's size and age limits."""
+
+
+class DirectoryStore(OutputStore):
+    """Objects in `root/<key[:2]>/<key>`, written atomically.
+
+    An object's mtime records when it was last used (reads touch it), so `trim`
+    drops objects unused for `max_age` seconds, then the least recently used ones
+    until the folder holds at most `max_bytes`.
+    """
+
+    def __init__(self, root: str, max_bytes: int = DEFAULT_MAX_BYTES, max_age: float = DEFAULT_MAX_AGE):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key)
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # read-only cache
+        return data
+
+    def put(self, key: str, data: bytes):
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = temp_output_path(path)
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            discard(tmp)
+            raise
+
+    def entries(self) -> list[tuple[float, int, str]]:
+        """(last used, size, path) of every object."""
+        found = []
+        try:
+            shards = [e for e in os.scandir(self.root) if e.is_dir() and len(e.name) == 2]
+        except OSError:
+            return found
+        for shard in shards:
+            with os.scandir(shard.path) as it:
+                for entry in it:
+                    if entry.is_file() and not entry.name.endswith(".tmp"):
+                        st = entry.stat()
+                        found.append((st.st_mtime, st.st_size, entry.path))
+        return found
+
+    def trim(self):
+        entries = sorted(self.entries())
+        cutoff = time.time() - self.max_age
+        total = sum(size for _, size, _ in entries)
+        for used, size, path in entries:
+            if used >= cutoff and total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+def open_store(root: str | None = None, max_bytes: int = DEFAULT_MAX_BYTES,
+               max_age: float = DEFAULT_MAX_AGE) -> DirectoryStore | None:
+    """The store at `root`, or at $UI2PY_CACHE; None when neither is set."""
+    root = root or os.environ.get(STORE_ENV)
+    return DirectoryStore(root, max_bytes, max_age) if root else None
@@ -0,0 +1,101 @@
+"""Extra artifacts written from one conversion: copies in other folders and .pyi stubs.
+
+uic runs once per form; every configured `Target` is derived from the generated
+module it produced. A stub declares the form class with a typed attribute for
+every widget and action `setupUi` creates, so type checkers and editors can
+resolve `self.ui.BtnConvert` without importing the generated code.
+"""
+import ast
+import os
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+
+from .optimize import _self_attr, _ui_class, format_import
+from .output import write_if_changed
+
+TARGET_KINDS = ("py", "pyi")
+
+
+@dataclass(frozen=True)
+class Target:
+    kind: str                     # "py" or "pyi"
+    directory: str | None = None  # None: next to the primary output
+
+    def path(self, output: str) -> str:
+        stem = os.path.splitext(os.path.basename(output))[0]
+        return os.path.normpath(os.path.join(self.directory or os.path.dirname(output), f"{stem}.{self.kind}"))
+
+
+def parse_target(spec: str) -> Target:
+    """"pyi", "pyi:stubs" or "py:build/forms"; raises ValueError."""
+    kind, _, directory = spec.partition(":")
+    if kind not in TARGET_KINDS:
+        raise ValueError(f"unknown target kind {kind!r} (choose from {', '.join(TARGET_KINDS)})")
+    if kind == "py" and not directory:
+        raise ValueError("a py target needs a directory (py:DIR)")
+    return Target(kind, directory or None)
+
+
+def form_class(ui_path: str) -> str:
+    """Class of the form's top-level widget, read from the first <widget> tag."""
+    for _, elem in ET.iterparse(ui_path, events=("start",)):
+        if elem.tag == "widget":
+            return elem.get("class") or "QWidget"
+    return "QWidget"
+
+
+def stub_source(source: str, root_class: str = "QWidget", form_name: str = "") -> str:
+    """A .pyi for a generated form module."""
+    tree = ast.parse(source)
+    node, methods = _ui_class(tree)
+    if node is None:
+        raise ValueError("no Ui_ class with setupUi and retranslateUi")
+    origin = {alias.asname or alias.name: stmt.module for stmt in tree.body if isinstance(stmt, ast.ImportFrom)
+              for alias in stmt.names}
+
+    attrs: dict[str, str] = {}
+    for sub in ast.walk(node):
+        if isinstance(sub, ast.Assign) and isinstance(sub.value, ast.Call) and isinstance(sub.value.func, ast.Name):
+            for target in sub.targets:
+                name = _self_attr(target)
+                if name and not name.startswith("_"):
+                    attrs.setdefault(name, sub.value.func.id)
+
+    lines = [f"class {node.name}(object):"]
+    lines += [f"    {name}: {cls}" for name, cls in attrs.items()]
+    for func in node.body:
+        if not isinstance(func, ast.FunctionDef) or func.name.startswith("_"):
+            continue
+        params = ["self"]
+        for arg in func.args.args[1:]:
+            annotated = func.name in ("setupUi", "retranslateUi") and arg is func.args.args[1]
+            params.append(f"{arg.arg}: {root_class}" if annotated else arg.arg)
+        lines.append(f"    def {func.name}({', '.join(params)}) -> None: ...")
+
+    by_module: dict[str, list[str]] = {}
+    for cls in dict.fromkeys([root_class, *attrs.values()]):
+        by_module.setdefault(origin.get(cls) or "PySide6.QtWidgets", []).append(cls)
+    header = f"# Stub for the form generated from '{form_name}'\n\n" if form_name else ""
+    imports = "".join(format_import(module, sorted(names)) for module, names in sorted(by_module.items()))
+    return header + imports + "\n\n" + "\n".join(lines) + "\n"
+
+
+def write_targets(src: str, output: str, targets: tuple[Target, ...], refresh: bool = True) -> list[str]:
+    """Write every target derived from `output`; returns their paths. With `refresh`
+    false (the output was up to date) only missing targets are written."""
+    paths, source, data = [], None, None
+    for target in targets:
+        path = target.path(output)
+        paths.append(path)
+        if not refresh and os.path.isfile(path):
+            continue
+        if data is None:
+            with open(output, "rb") as f:
+                data = f.read()
+        if target.kind == "pyi":
+            if source is None:
+                source = stub_source(data.decode("utf-8"), form_class(src), os.path.basename(src))
+            write_if_changed(path, source.encode("utf-8"))
+        else:
+            write_if_changed(path, data)
+    return paths
@@ -0,0 +1,215 @@
+"""Watch project directories and regenerate ui_*.py when a .ui file is saved.
+
+Uses QtCore's QFileSystemWatcher (inotify / FSEvents / ReadDirectoryChangesW), so
+no file is polled. Only QtCore is imported; this still runs without a display.
+When the converter compiles resources, the .qrc files the forms include and the
+files those list are watched too, and a change rebuilds only what depends on it.
+"""
+import os
+import sys
+from typing import Callable, Iterable
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from .core import Converter, FileResult, make_jobs
+from .deps import DependencyGraph
+from .filestore import path_key
+from .scan import list_ui_dir, walk_ui_tree
+
+
+DEBOUNCE_MS = 300
+
+
+def walk_ui_files(roots: Iterable[str], base: str | None = None) -> tuple[list[str], list[str]]:
+    """All directories and .ui files below `roots`, with the folder scan's rules: ignored
+    and symlinked directories are skipped. `base` is the watched root the `roots` lie in."""
+    dirs, files = [], []
+    for root in roots:
+        for path, is_dir in walk_ui_tree(root, base=base):
+            (dirs if is_dir else files).append(path)
+    return dirs, files
+
+
+class _BatchRunner(QRunnable):
+    def __init__(self, converter: Converter, files: list[str], out_dir: str | None, watcher: "UiWatcher"):
+        super().__init__()
+        self.converter = converter
+        self.files = files
+        self.out_dir = out_dir
+        self.watcher = watcher
+
+    def run(self):
+        try:
+            jobs = make_jobs(self.files, self.out_dir)
+            self.converter.convert(jobs, on_result=self.watcher.file_rebuilt.emit)
+        except Exception as e:  # report it and keep watching
+            print(f"ui2py: rebuild failed: {type(e).__name__}: {e}", file=sys.stderr)
+        finally:
+            self.watcher._batch_done.emit()
+
+
+class UiWatcher(QObject):
+    """Debounced, coalescing rebuilder for every .ui file below a set of directories.
+
+    Change events are collected into a set and flushed `debounce_ms` after the last
+    one, so a burst of Designer saves becomes a single rebuild of the touched files.
+    Rebuilds run on a worker thread, one batch at a time; events arriving during a
+    batch are queued for the next one. The converter's manifest skips files whose
+    content did not actually change. Folders are found with the folder scan's rules,
+    so ignored and symlinked directories get no watch.
+    """
+
+    file_rebuilt = Signal(object)  # FileResult
+    _batch_done = Signal()
+
+    def __init__(self, roots: Iterable[str], converter: Converter, out_dir: str | None = None,
+                 debounce_ms: int = DEBOUNCE_MS, parent: QObject | None = None):
+        super().__init__(parent)
+        self.roots = [os.path.normpath(r) for r in roots]
+        self.converter = converter
+        self.out_dir = out_dir
+        self._pending: set[str] = set()
+        self._running = False
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._flush)
+
+        self._fs = QFileSystemWatcher(self)
+        self._fs.fileChanged.connect(self._on_file_changed)
+        self._fs.directoryChanged.connect(self._on_directory_changed)
+        self._batch_done.connect(self._on_batch_done)
+
+        self.graph = DependencyGraph() if converter.rcc is not None else None
+        if self.graph is not None:
+            self.file_rebuilt.connect(self._on_file_rebuilt)
+
+    def start(self, initial_build: bool = True) -> list[str]:
+        """Begin watching; returns the .ui files found."""
+        dirs, files = walk_ui_files(self.roots)
+        self._watch(dirs + files)
+        if self.graph is not None:
+            for f in files:
+                self.graph.add_form(f)
+            self._watch_dependencies()
+        if initial_build:
+            self._schedule(files)
+        return files
+
+    def stop(self):
+        self._timer.stop()
+        self._pending.clear()
+        paths = self._fs.files() + self._fs.directories()
+        if paths:
+            self._fs.removePaths(paths)
+        self._pool.waitForDone()
+
+    def _watch(self, paths: list[str]):
+        if paths:
+            self._fs.addPaths(paths)
+
+    def _watch_dependencies(self):
+        watched = set(self._fs.files())
+        self._watch([p for p in self.graph.dependencies() if p not in watched and os.path.isfile(p)])
+
+    def _on_file_rebuilt(self, result: FileResult):
+        """Forms may have gained or dropped resources since the graph was built."""
+        if result.kind == "ui" and (not result.up_to_date or path_key(result.job.src) not in self.graph.forms):
+            self.graph.add_form(result.job.src)
+            self._watch_dependencies()
+
+    def _schedule(self, files: Iterable[str]):
+        self._pending.update(files)
+        if self._pending:
+            self._timer.start()
+
+    def _on_file_changed(self, path: str):
+        if not os.path.isfile(path):
+            # Deleted, or replaced by an atomic save: the new file is picked up as it appears
+            if self.graph is not None and path.endswith((".ui", ".qrc")):
+                self.graph.remove(path)
+            return
+        # Atomic saves replace the inode; make sure it is still watched
+        if path not in self._fs.files():
+            self._fs.addPath(path)
+        if path.endswith(".ui") or self.graph is None:
+            self._schedule([path])
+            return
+        if path.endswith(".qrc"):
+            self.graph.add_resource(path)
+            self._watch_dependencies()
+        forms, _ = self.graph.affected([path])
+        self._schedule(forms)
+
+    def _on_directory_changed(self, directory: str):
+        """A file or folder was created, removed or renamed in `directory`."""
+        if not os.path.isdir(directory):
+            return
+        root = self._root_of(directory)
+        watched = set(self._fs.files()) | set(self._fs.directories())
+        subdirs, files = list_ui_dir(directory, root)
+        new_dirs, new_files = [], [f for f in files if f not in watched and os.path.isfile(f)]
+        for path in subdirs:
+            if path not in watched:
+                dirs, found = walk_ui_files([path], base=root)
+                new_dirs += dirs
+                new_files += found
+        self._watch(new_dirs + new_files)
+        self._schedule(new_files)
+        if self.graph is not None:
+            self._restore_dependencies(watched)
+
+    def _restore_dependencies(self, watched: set[str]):
+        """Re-read .qrc files that forms still include and that exist again, e.g. after an atomic save."""
+        back = [p for p in self.graph.dependencies() if p not in watched and os.path.isfile(p)]
+        for path in back:
+            if path.endswith(".qrc"):
+                self.graph.add_resource(path)
+        self._watch_dependencies()
+        forms, _ = self.graph.affected(back)
+        self._schedule(forms)
+
+    def _root_of(self, path: str) -> str:
+        return next((r for r in self.roots if path == r or path.startswith(r.rstrip(os.sep) + os.sep)), path)
+
+    def _flush(self):
+        if self._running or not self._pending:
+            return
+        files = sorted(f for f in self._pending if os.path.isfile(f))
+        self._pending.clear()
+        if not files:
+            return
+        self._running = True
+        self._pool.start(_BatchRunner(self.converter, files, self.out_dir, self))
+
+    def _on_batch_done(self):
+        self._running = False
+        if self._pending:
+            self._timer.start()
+
+
+def run_watch(roots: list[str], converter: Converter, out_dir: str | None = None,
+              on_result: Callable[[FileResult], None] | None = None) -> int:
+    """Blocking watch loop for the CLI; returns when interrupted with Ctrl+C."""
+    import signal
+    from PySide6.QtCore import QCoreApplication
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    watcher = UiWatcher(roots, converter, out_dir)
+    if on_result is not None:
+        watcher.file_rebuilt.connect(on_result)
+
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    # Give the Python interpreter a chance to run the signal handler
+    heartbeat = QTimer()
+    heartbeat.timeout.connect(lambda: None)
+    heartbeat.start(200)
+
+    files = watcher.start()
+    print(f"Watching {len(files)} .ui file(s) in {', '.join(watcher.roots)} (Ctrl+C to stop)")
+    app.exec()
+    watcher.stop()
+    return 0